@@ -0,0 +1,41 @@
+"""add_documents_keyset_pagination_index
+
+Revision ID: 3c5e9a1f7b20
+Revises: ad79818fc717
+Create Date: 2025-07-17 10:41:18.903562
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c5e9a1f7b20'
+down_revision: Union[str, None] = 'ad79818fc717'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keyset pagination: WHERE (created_at, id) < (:before, :before_id)
+    # ORDER BY created_at DESC, id DESC is a backward range scan on this index.
+    # Built concurrently (outside the migration transaction) so uploads are
+    # not blocked while the index is created on an existing table.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_documents_created_at_id',
+            'documents',
+            ['created_at', 'id'],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_documents_created_at_id',
+            table_name='documents',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,48 @@
+"""convert_agent_type_enum_to_varchar
+
+Revision ID: 5b1f0c7a9e24
+Revises: d0952017e8e6
+Create Date: 2025-07-15 14:37:02.918446
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b1f0c7a9e24'
+down_revision: Union[str, None] = 'd0952017e8e6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Store agent_type as plain VARCHAR guarded by a CHECK constraint so new
+    # agent types only need a constraint swap instead of enum type surgery.
+    op.alter_column(
+        'agents',
+        'agent_type',
+        type_=sa.String(length=8),
+        existing_type=sa.Enum('main', 'sub', name='agenttype'),
+        postgresql_using='agent_type::text',
+        existing_nullable=False,
+    )
+    op.create_check_constraint(
+        'ck_agents_agent_type', 'agents', "agent_type IN ('main', 'sub')"
+    )
+    op.execute("DROP TYPE IF EXISTS agenttype")
+
+
+def downgrade() -> None:
+    op.drop_constraint('ck_agents_agent_type', 'agents', type_='check')
+    op.execute("CREATE TYPE agenttype AS ENUM ('main', 'sub')")
+    op.alter_column(
+        'agents',
+        'agent_type',
+        type_=sa.Enum('main', 'sub', name='agenttype'),
+        existing_type=sa.String(length=8),
+        postgresql_using='agent_type::agenttype',
+        existing_nullable=False,
+    )
@@ -5,14 +5,10 @@ Revises: ea811df5372c
 Create Date: 2025-07-14 21:05:35.879928
 
 """
-from datetime import datetime
 from typing import Sequence, Union
-from uuid import UUID
 
 from alembic import op
 import sqlalchemy as sa
-from sqlalchemy.dialects import postgresql
-from passlib.context import CryptContext
 
 # revision identifiers, used by Alembic.
 revision: str = '6e4830d17465'
@@ -20,8 +16,17 @@ down_revision: Union[str, None] = 'ea811df5372c'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Precomputed bcrypt hash (12 rounds) of the placeholder password
+# "defaultpassword", so running the migration never loads or calls bcrypt.
+# Regenerate with:
+#   python -c "from passlib.context import CryptContext; \
+#       print(CryptContext(schemes=['bcrypt']).hash('defaultpassword'))"
+DEFAULT_SYSTEM_USER_PASSWORD_HASH = (
+    '$2b$12$0jW36SMu7MIGt8/9deGrseNUcbrlrAWYDLqFOEN729W1JT6ywvIii'
+)
+
+DEFAULT_SYSTEM_USER_ID = '00000000-0000-0000-0000-000000000000'
+
 
 def upgrade() -> None:
     # ### commands auto generated by Alembic - please adjust! ###
@@ -29,36 +34,23 @@ def upgrade() -> None:
                existing_type=sa.BOOLEAN(),
                server_default=None,
                existing_nullable=True)
-    
-    # Add default system user
-    users_table = sa.table(
-        'users',
-        sa.Column('id', postgresql.UUID(as_uuid=True)),
-        sa.Column('email', sa.String()),
-        sa.Column('hashed_password', sa.String()),
-        sa.Column('is_active', sa.Boolean()),
-        sa.Column('is_superuser', sa.Boolean()),
-        sa.Column('created_at', sa.DateTime(timezone=True)),
-        sa.Column('updated_at', sa.DateTime(timezone=True))
-    )
-    
-    # Hash the default password
-    hashed_password = pwd_context.hash("defaultpassword")
-    
-    # Insert the default system user
-    op.bulk_insert(
-        users_table,
-        [
-            {
-                'id': UUID('00000000-0000-0000-0000-000000000000'),
-                'email': 'system@logydesk.com',
-                'hashed_password': hashed_password,
-                'is_active': True,
-                'is_superuser': True,
-                'created_at': datetime.utcnow(),
-                'updated_at': datetime.utcnow()
-            }
-        ]
+
+    # Insert the default system user (no-op if it already exists)
+    op.execute(
+        sa.text(
+            """
+            INSERT INTO users
+                (id, email, hashed_password, is_active, is_superuser,
+                 created_at, updated_at)
+            VALUES
+                (:id, :email, :hashed_password, true, true, now(), now())
+            ON CONFLICT (id) DO NOTHING
+            """
+        ).bindparams(
+            id=DEFAULT_SYSTEM_USER_ID,
+            email='system@logydesk.com',
+            hashed_password=DEFAULT_SYSTEM_USER_PASSWORD_HASH,
+        )
     )
     # ### end Alembic commands ###
 
@@ -72,6 +64,6 @@ def downgrade() -> None:
     
     # Remove the default system user
     op.execute(
-        "DELETE FROM users WHERE id = '00000000-0000-0000-0000-000000000000'"
+        f"DELETE FROM users WHERE id = '{DEFAULT_SYSTEM_USER_ID}'"
     )
     # ### end Alembic commands ###
@@ -8,9 +8,6 @@ Create Date: 2025-07-12 23:54:08.625801
 
 from typing import Sequence, Union
 
-import sqlalchemy as sa
-from sqlalchemy.dialects import postgresql
-
 from alembic import op
 
 # revision identifiers, used by Alembic.
@@ -19,46 +16,40 @@ down_revision: Union[str, None] = "8a132099c50f"
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
-# Define the old and new enum types
-old_agent_type_enum = postgresql.ENUM("MAIN", "SUB", name="agenttype")
-new_agent_type_enum = postgresql.ENUM("main", "sub", name="agenttype")
-
+# Enum labels renamed by this migration (old label -> new label)
+AGENT_TYPE_LABELS = (("MAIN", "main"), ("SUB", "sub"))
 
-def upgrade() -> None:
-    # Create a temporary type to convert to text first
-    op.execute("ALTER TYPE agenttype RENAME TO agenttype_old")
 
-    # Create new enum type
-    new_agent_type_enum.create(op.get_bind())
+def _rename_enum_value(old: str, new: str) -> None:
+    """Rename an agenttype label in place if the old label is present.
 
-    # Update the column to use the new type
+    ALTER TYPE ... RENAME VALUE only touches the pg_enum catalog, so unlike
+    recreating the type and casting the column it neither rewrites nor
+    locks the agents table. Skipping absent labels keeps it idempotent.
+    """
     op.execute(
+        f"""
+        DO $$
+        BEGIN
+            IF EXISTS (
+                SELECT 1
+                FROM pg_enum e
+                JOIN pg_type t ON t.oid = e.enumtypid
+                WHERE t.typname = 'agenttype' AND e.enumlabel = '{old}'
+            ) THEN
+                ALTER TYPE agenttype RENAME VALUE '{old}' TO '{new}';
+            END IF;
+        END
+        $$;
         """
-        ALTER TABLE agents 
-        ALTER COLUMN agent_type TYPE agenttype 
-        USING agent_type::text::agenttype
-    """
     )
 
-    # Drop the old type
-    op.execute("DROP TYPE agenttype_old")
-
-
-def downgrade() -> None:
-    # Convert back to old type
-    op.execute("ALTER TYPE agenttype RENAME TO agenttype_new")
 
-    # Create old enum type
-    old_agent_type_enum.create(op.get_bind())
+def upgrade() -> None:
+    for old, new in AGENT_TYPE_LABELS:
+        _rename_enum_value(old, new)
 
-    # Update the column to use the old type
-    op.execute(
-        """
-        ALTER TABLE agents 
-        ALTER COLUMN agent_type TYPE agenttype 
-        USING agent_type::text::agenttype
-    """
-    )
 
-    # Drop the new type
-    op.execute("DROP TYPE agenttype_new")
+def downgrade() -> None:
+    for old, new in AGENT_TYPE_LABELS:
+        _rename_enum_value(new, old)
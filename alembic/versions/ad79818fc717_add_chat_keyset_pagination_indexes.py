@@ -0,0 +1,53 @@
+"""add_chat_keyset_pagination_indexes
+
+Revision ID: ad79818fc717
+Revises: de792a91921a
+Create Date: 2025-07-16 15:22:07.640913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ad79818fc717'
+down_revision: Union[str, None] = 'de792a91921a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keyset pagination: WHERE (created_at, id) > (:after, :after_id)
+    # ORDER BY created_at, id is served by a range scan on these indexes.
+    # The chat_messages index also covers the session_id FK lookups.
+    # Built concurrently (outside the migration transaction) so new messages
+    # and sessions are not blocked while the indexes are created.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_chat_messages_session_id_created_at_id',
+            'chat_messages',
+            ['session_id', 'created_at', 'id'],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_chat_sessions_created_at_id',
+            'chat_sessions',
+            ['created_at', 'id'],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_chat_sessions_created_at_id',
+            table_name='chat_sessions',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_chat_messages_session_id_created_at_id',
+            table_name='chat_messages',
+            postgresql_concurrently=True,
+        )
@@ -8,9 +8,6 @@ Create Date: 2025-07-09 18:06:52.020696
 
 from typing import Sequence, Union
 
-import sqlalchemy as sa
-from sqlalchemy.dialects import postgresql
-
 from alembic import op
 
 # revision identifiers, used by Alembic.
@@ -20,203 +17,44 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
+# Tables whose created_at/updated_at columns become timezone-aware.
+# Both columns of a table are altered in a single ALTER TABLE statement so
+# PostgreSQL rewrites each table once instead of once per column.
+TIMESTAMP_TABLES = (
+    "agents",
+    "chat_messages",
+    "chat_sessions",
+    "document_chunks",
+    "documents",
+    "users",
+)
+
+
 def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    op.alter_column(
-        "agents",
-        "created_at",
-        existing_type=postgresql.TIMESTAMP(),
-        server_default=sa.text("now()"),
-        type_=sa.DateTime(timezone=True),
-        existing_nullable=True,
-    )
-    op.alter_column(
-        "agents",
-        "updated_at",
-        existing_type=postgresql.TIMESTAMP(),
-        server_default=sa.text("now()"),
-        type_=sa.DateTime(timezone=True),
-        existing_nullable=True,
-    )
-    op.alter_column(
-        "chat_messages",
-        "created_at",
-        existing_type=postgresql.TIMESTAMP(),
-        server_default=sa.text("now()"),
-        type_=sa.DateTime(timezone=True),
-        existing_nullable=True,
-    )
-    op.alter_column(
-        "chat_messages",
-        "updated_at",
-        existing_type=postgresql.TIMESTAMP(),
-        server_default=sa.text("now()"),
-        type_=sa.DateTime(timezone=True),
-        existing_nullable=True,
-    )
-    op.alter_column(
-        "chat_sessions",
-        "created_at",
-        existing_type=postgresql.TIMESTAMP(),
-        server_default=sa.text("now()"),
-        type_=sa.DateTime(timezone=True),
-        existing_nullable=True,
-    )
-    op.alter_column(
-        "chat_sessions",
-        "updated_at",
-        existing_type=postgresql.TIMESTAMP(),
-        server_default=sa.text("now()"),
-        type_=sa.DateTime(timezone=True),
-        existing_nullable=True,
-    )
-    op.alter_column(
-        "document_chunks",
-        "created_at",
-        existing_type=postgresql.TIMESTAMP(),
-        server_default=sa.text("now()"),
-        type_=sa.DateTime(timezone=True),
-        existing_nullable=True,
-    )
-    op.alter_column(
-        "document_chunks",
-        "updated_at",
-        existing_type=postgresql.TIMESTAMP(),
-        server_default=sa.text("now()"),
-        type_=sa.DateTime(timezone=True),
-        existing_nullable=True,
-    )
-    op.alter_column(
-        "documents",
-        "created_at",
-        existing_type=postgresql.TIMESTAMP(),
-        server_default=sa.text("now()"),
-        type_=sa.DateTime(timezone=True),
-        existing_nullable=True,
-    )
-    op.alter_column(
-        "documents",
-        "updated_at",
-        existing_type=postgresql.TIMESTAMP(),
-        server_default=sa.text("now()"),
-        type_=sa.DateTime(timezone=True),
-        existing_nullable=True,
-    )
-    op.alter_column(
-        "users",
-        "created_at",
-        existing_type=postgresql.TIMESTAMP(),
-        server_default=sa.text("now()"),
-        type_=sa.DateTime(timezone=True),
-        existing_nullable=True,
-    )
-    op.alter_column(
-        "users",
-        "updated_at",
-        existing_type=postgresql.TIMESTAMP(),
-        server_default=sa.text("now()"),
-        type_=sa.DateTime(timezone=True),
-        existing_nullable=True,
-    )
-    # ### end Alembic commands ###
+    for table in TIMESTAMP_TABLES:
+        op.execute(
+            f"""
+            ALTER TABLE {table}
+                ALTER COLUMN created_at TYPE TIMESTAMP WITH TIME ZONE
+                    USING created_at AT TIME ZONE 'UTC',
+                ALTER COLUMN created_at SET DEFAULT now(),
+                ALTER COLUMN updated_at TYPE TIMESTAMP WITH TIME ZONE
+                    USING updated_at AT TIME ZONE 'UTC',
+                ALTER COLUMN updated_at SET DEFAULT now()
+            """
+        )
 
 
 def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    op.alter_column(
-        "users",
-        "updated_at",
-        existing_type=sa.DateTime(timezone=True),
-        server_default=None,
-        type_=postgresql.TIMESTAMP(),
-        existing_nullable=True,
-    )
-    op.alter_column(
-        "users",
-        "created_at",
-        existing_type=sa.DateTime(timezone=True),
-        server_default=None,
-        type_=postgresql.TIMESTAMP(),
-        existing_nullable=True,
-    )
-    op.alter_column(
-        "documents",
-        "updated_at",
-        existing_type=sa.DateTime(timezone=True),
-        server_default=None,
-        type_=postgresql.TIMESTAMP(),
-        existing_nullable=True,
-    )
-    op.alter_column(
-        "documents",
-        "created_at",
-        existing_type=sa.DateTime(timezone=True),
-        server_default=None,
-        type_=postgresql.TIMESTAMP(),
-        existing_nullable=True,
-    )
-    op.alter_column(
-        "document_chunks",
-        "updated_at",
-        existing_type=sa.DateTime(timezone=True),
-        server_default=None,
-        type_=postgresql.TIMESTAMP(),
-        existing_nullable=True,
-    )
-    op.alter_column(
-        "document_chunks",
-        "created_at",
-        existing_type=sa.DateTime(timezone=True),
-        server_default=None,
-        type_=postgresql.TIMESTAMP(),
-        existing_nullable=True,
-    )
-    op.alter_column(
-        "chat_sessions",
-        "updated_at",
-        existing_type=sa.DateTime(timezone=True),
-        server_default=None,
-        type_=postgresql.TIMESTAMP(),
-        existing_nullable=True,
-    )
-    op.alter_column(
-        "chat_sessions",
-        "created_at",
-        existing_type=sa.DateTime(timezone=True),
-        server_default=None,
-        type_=postgresql.TIMESTAMP(),
-        existing_nullable=True,
-    )
-    op.alter_column(
-        "chat_messages",
-        "updated_at",
-        existing_type=sa.DateTime(timezone=True),
-        server_default=None,
-        type_=postgresql.TIMESTAMP(),
-        existing_nullable=True,
-    )
-    op.alter_column(
-        "chat_messages",
-        "created_at",
-        existing_type=sa.DateTime(timezone=True),
-        server_default=None,
-        type_=postgresql.TIMESTAMP(),
-        existing_nullable=True,
-    )
-    op.alter_column(
-        "agents",
-        "updated_at",
-        existing_type=sa.DateTime(timezone=True),
-        server_default=None,
-        type_=postgresql.TIMESTAMP(),
-        existing_nullable=True,
-    )
-    op.alter_column(
-        "agents",
-        "created_at",
-        existing_type=sa.DateTime(timezone=True),
-        server_default=None,
-        type_=postgresql.TIMESTAMP(),
-        existing_nullable=True,
-    )
-    # ### end Alembic commands ###
+    for table in reversed(TIMESTAMP_TABLES):
+        op.execute(
+            f"""
+            ALTER TABLE {table}
+                ALTER COLUMN updated_at DROP DEFAULT,
+                ALTER COLUMN updated_at TYPE TIMESTAMP WITHOUT TIME ZONE
+                    USING updated_at AT TIME ZONE 'UTC',
+                ALTER COLUMN created_at DROP DEFAULT,
+                ALTER COLUMN created_at TYPE TIMESTAMP WITHOUT TIME ZONE
+                    USING created_at AT TIME ZONE 'UTC'
+            """
+        )
@@ -0,0 +1,30 @@
+"""add_unique_agent_name_per_user
+
+Revision ID: d9ba4fb5e400
+Revises: 5b1f0c7a9e24
+Create Date: 2025-07-16 09:48:21.550173
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9ba4fb5e400'
+down_revision: Union[str, None] = '5b1f0c7a9e24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Agent names are unique per user; create_agent relies on this index for
+    # INSERT ... ON CONFLICT (user_id, name) DO NOTHING.
+    op.create_index(
+        'uq_agents_user_id_name', 'agents', ['user_id', 'name'], unique=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_agents_user_id_name', table_name='agents')
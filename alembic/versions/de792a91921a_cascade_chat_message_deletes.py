@@ -0,0 +1,41 @@
+"""cascade_chat_message_deletes
+
+Revision ID: de792a91921a
+Revises: d9ba4fb5e400
+Create Date: 2025-07-16 13:05:42.118305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'de792a91921a'
+down_revision: Union[str, None] = 'd9ba4fb5e400'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+FK_NAME = 'chat_messages_session_id_fkey'
+
+
+def upgrade() -> None:
+    # Deleting a chat session removes its messages in the database, so the
+    # API issues a single DELETE instead of one per message.
+    op.drop_constraint(FK_NAME, 'chat_messages', type_='foreignkey')
+    op.create_foreign_key(
+        FK_NAME,
+        'chat_messages',
+        'chat_sessions',
+        ['session_id'],
+        ['id'],
+        ondelete='CASCADE',
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(FK_NAME, 'chat_messages', type_='foreignkey')
+    op.create_foreign_key(
+        FK_NAME, 'chat_messages', 'chat_sessions', ['session_id'], ['id']
+    )
@@ -9,7 +9,6 @@ Create Date: 2025-07-13 00:18:02.416844
 from typing import Sequence, Union
 
 import sqlalchemy as sa
-from sqlalchemy.dialects import postgresql
 
 from alembic import op
 
@@ -21,6 +20,26 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
+    # 6fbd90d378bc already renames the enum labels to lowercase in place, so
+    # on a normal upgrade path there is nothing left to fix. Only fall back to
+    # the full text-cast/recreate (two rewrites of agents) if the labels are
+    # still not the expected lowercase set.
+    labels = {
+        row[0]
+        for row in op.get_bind().execute(
+            sa.text(
+                """
+                SELECT e.enumlabel
+                FROM pg_enum e
+                JOIN pg_type t ON t.oid = e.enumtypid
+                WHERE t.typname = 'agenttype'
+                """
+            )
+        )
+    }
+    if labels == {"main", "sub"}:
+        return
+
     # Create a temporary type to convert to text first
     op.execute(
         """
@@ -37,11 +56,13 @@ def upgrade() -> None:
     op.execute("CREATE TYPE agenttype AS ENUM ('main', 'sub')")
 
     # Convert the text values to the new enum type
+    # Only rows that are not already lowercase are rewritten, so re-runs and
+    # already-normalised tables produce no row locks or WAL for this UPDATE.
     op.execute(
         """
         UPDATE agents 
         SET agent_type = LOWER(agent_type)
-        WHERE agent_type IS NOT NULL;
+        WHERE agent_type <> LOWER(agent_type);
         
         ALTER TABLE agents 
         ALTER COLUMN agent_type TYPE agenttype 
@@ -1,17 +1,42 @@
-from typing import List
+from typing import FrozenSet, List, Optional, Tuple
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import DEFAULT_USER_ID, settings
 from app.crud import crud_agent
 from app.db.session import get_db
 from app.schemas import agent as schemas
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
-# Default user ID for MVP
-DEFAULT_USER_ID = UUID("00000000-0000-0000-0000-000000000000")  # Changed to UUID object
+# Valid agent types accepted by the list filters
+AGENT_TYPES: FrozenSet[str] = frozenset({"main", "sub"})
+
+# 에이전트 목록은 자주 바뀌지 않으므로 직렬화된 JSON 본문을 짧게 캐시합니다.
+# 키: (agent_type, skip, limit) / 생성·수정·삭제 시 전체 무효화
+# (MAIN 에이전트 캐시도 함께 무효화)
+AGENT_LIST_CACHE_TTL = 5
+_agents_cache: "TTLCache[Tuple[Optional[str], int, int], bytes]" = TTLCache(
+    maxsize=1024, ttl=AGENT_LIST_CACHE_TTL
+)
+_agent_list_adapter = TypeAdapter(List[schemas.Agent])
+
+AGENT_NOT_FOUND_DETAIL = "에이전트를 찾을 수 없습니다."
+
+
+def agent_not_found() -> HTTPException:
+    """
+    404 예외를 생성합니다.
+
+    예외 인스턴스를 공유하면 raise 할 때마다 traceback 이 누적되므로,
+    상세 메시지만 상수로 두고 예외는 매번 새로 만듭니다.
+    """
+    return HTTPException(status_code=404, detail=AGENT_NOT_FOUND_DETAIL)
 
 
 @router.post("", response_model=schemas.Agent, status_code=status.HTTP_201_CREATED)
@@ -28,34 +53,66 @@ async def create_agent(
     - **system_prompt**: 시스템 프롬프트
     """
     # For MVP, use a default user ID
-    agent_data = agent_in.model_dump()  # Use model_dump()
+    # agent_in is already validated by FastAPI, so build the payload without
+    # running validation a second time
+    agent_data = agent_in.model_dump()
     agent_data["user_id"] = DEFAULT_USER_ID
 
-    db_agent = await crud_agent.agent.get_by_name(db, user_id=DEFAULT_USER_ID, name=agent_in.name)
-    if db_agent:
+    # 이름 중복은 (user_id, name) 유니크 인덱스가 INSERT 시점에 판단
+    db_agent = await crud_agent.agent.create_unique_name(
+        db, obj_in=schemas.AgentCreate.model_construct(**agent_data)
+    )
+    if db_agent is None:
         raise HTTPException(
             status_code=400, detail="이미 존재하는 에이전트 이름입니다."
         )
-    return await crud_agent.agent.create(
-        db, obj_in=schemas.AgentCreate(**agent_data)
-    )
+    _agents_cache.clear()
+    crud_agent.agent.clear_main_agent_cache()
+    return db_agent
 
 
 @router.get("", response_model=List[schemas.Agent])
 async def list_agents(
-    skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_db)
-) -> List[schemas.Agent]:  # Added return type
+    agent_type: Optional[str] = None,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(
+        settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE
+    ),
+    db: AsyncSession = Depends(get_db),
+) -> Response:
     """
     모든 에이전트 목록을 조회합니다 (개발용 - 인증 없음).
 
+    - **agent_type**: 필터링할 에이전트 유형 ('main' 또는 'sub', 선택)
     - **skip**: 건너뛸 레코드 수 (페이징용)
-    - **limit**: 반환할 최대 레코드 수 (페이징용)
+    - **limit**: 반환할 최대 레코드 수 (페이징용, 최대 MAX_PAGE_SIZE)
     """
     # For MVP, return all agents without user filtering
-    agents = await crud_agent.agent.get_multi(db, skip=skip, limit=limit)
-    return [
-        schemas.Agent.model_validate(agent) for agent in agents
-    ]  # Return list of Agent instances
+    if agent_type and agent_type not in AGENT_TYPES:
+        raise HTTPException(
+            status_code=400, detail="유효하지 않은 에이전트 유형입니다."
+        )
+
+    cache_key = (agent_type or None, skip, limit)
+    body = _agents_cache.get(cache_key)
+    if body is not None:
+        return Response(content=body, media_type="application/json")
+
+    if agent_type:
+        # agent_type 인덱스(ix_agents_agent_type)를 사용하는 필터 조회
+        agents = await crud_agent.agent.get_multi_by_type(
+            db, agent_type=agent_type, skip=skip, limit=limit
+        )
+    else:
+        agents = await crud_agent.agent.get_multi(db, skip=skip, limit=limit)
+
+    # ORM rows are converted and serialized once here; returning a Response
+    # makes FastAPI skip the response_model pass
+    body = _agent_list_adapter.dump_json(
+        _agent_list_adapter.validate_python(agents, from_attributes=True)
+    )
+    _agents_cache[cache_key] = body
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/{agent_id}", response_model=schemas.Agent)
@@ -69,8 +126,9 @@ async def get_agent(
     """
     db_agent = await crud_agent.agent.get(db, id=agent_id)
     if not db_agent:
-        raise HTTPException(status_code=404, detail="에이전트를 찾을 수 없습니다.")
-    return schemas.Agent.model_validate(db_agent)  # Return Agent instance
+        raise agent_not_found()
+    # response_model converts the ORM row (from_attributes) in a single pass
+    return db_agent
 
 
 @router.put("/{agent_id}", response_model=schemas.Agent)
@@ -85,9 +143,11 @@ async def update_agent(
     """
     db_agent = await crud_agent.agent.get(db, id=agent_id)
     if not db_agent:
-        raise HTTPException(status_code=404, detail="에이전트를 찾을 수 없습니다.")
+        raise agent_not_found()
     updated_agent = await crud_agent.agent.update(db, db_obj=db_agent, obj_in=agent_in)
-    return schemas.Agent.model_validate(updated_agent)  # Return Agent instance
+    _agents_cache.clear()
+    crud_agent.agent.clear_main_agent_cache()
+    return updated_agent
 
 
 @router.delete("/{agent_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -101,6 +161,8 @@ async def delete_agent(
     """
     db_agent = await crud_agent.agent.get(db, id=agent_id)
     if not db_agent:
-        raise HTTPException(status_code=404, detail="에이전트를 찾을 수 없습니다.")
+        raise agent_not_found()
     await crud_agent.agent.remove(db, id=agent_id)
+    _agents_cache.clear()
+    crud_agent.agent.clear_main_agent_cache()
     # 204 No Content 반환 (본문 없음)
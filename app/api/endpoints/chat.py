@@ -1,28 +1,352 @@
-from datetime import datetime, timezone
-from typing import Dict, List
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import accumulate, chain
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
 from uuid import UUID
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import DEFAULT_USER_ID, settings
+from app.api.endpoints.chat_sessions import chat_session_not_found
 from app.crud import crud_chat, crud_agent
-from app.db.session import get_db
+from app.db.session import async_session_maker, get_db
+from app.models.models import Agent, ChatMessage
 from app.schemas import chat as schemas
-from app.services.llm_client import LLMClient
+from app.services.llm_client import FALLBACK_RESPONSE, llm_client
+from app.services.response_cache import response_cache
 from app.core.logging_config import get_logger
+from app.core.profiling import stage_timer
+from app.core.timeutils import utcnow
 
-# Default user ID for MVP
-DEFAULT_USER_ID = UUID("00000000-0000-0000-0000-000000000001")
+# 메시지 역할 상수
+ROLE_USER = "user"
+ROLE_ASSISTANT = "assistant"
+ROLE_SYSTEM = "system"
 
-router = APIRouter()
+# AI 응답 저장 시도 횟수 (첫 시도 + 재시도 1회)
+PERSIST_ATTEMPTS = 2
+
+# 실행 중인 응답 저장 태스크 (완료 전에 가비지 컬렉션되지 않도록 참조 유지)
+_pending_persists: Set["asyncio.Task[Optional[UUID]]"] = set()
+
+# LLM 컨텍스트로 사용할 최근 메시지 수 (4개 대화 쌍 정도)
+CONTEXT_MESSAGE_LIMIT = 8
+
+# 컨텍스트로 보낼 이전 메시지 본문의 최대 글자 수 (대략 6000 토큰)
+CONTEXT_CHAR_BUDGET = 24000
+
+
+@dataclass(frozen=True)
+class AgentSettings:
+    """LLM 호출에 사용하는 에이전트 설정 (읽기 전용)."""
+
+    # 요청마다 생성되므로 인스턴스 __dict__ 없이 슬롯만 사용
+    __slots__ = ("model", "temperature", "system_prompt")
+
+    model: str
+    temperature: float
+    system_prompt: str
+
+
+# MAIN 에이전트가 없거나 값이 비어 있을 때 사용하는 기본 설정
+DEFAULT_AGENT_SETTINGS = AgentSettings(
+    model="gpt-3.5-turbo",
+    temperature=0.7,
+    system_prompt="당신은 도움이 되는 AI 어시스턴트입니다.",
+)
+
+
+router = APIRouter(default_response_class=ORJSONResponse)
 logger = get_logger(__name__)
 
 
+async def _load_main_agent() -> Optional[Agent]:
+    """
+    MAIN 에이전트를 별도의 세션으로 조회합니다.
+
+    AsyncSession 은 동시 쿼리를 지원하지 않으므로, 요청 세션의 조회와
+    asyncio.gather 로 함께 실행할 수 있도록 독립된 세션을 사용합니다.
+    """
+    async with async_session_maker() as agent_db:
+        return await crud_agent.agent.get_main_agent(
+            agent_db, user_id=DEFAULT_USER_ID
+        )
+
+
+def _resolve_agent_settings(main_agent: Optional[Agent]) -> AgentSettings:
+    """기본 설정 위에 MAIN 에이전트의 값(비어 있지 않은 것만)을 덮어씁니다."""
+    if not main_agent:
+        return DEFAULT_AGENT_SETTINGS
+    agent_settings = AgentSettings(
+        model=main_agent.model or DEFAULT_AGENT_SETTINGS.model,
+        temperature=main_agent.temperature or DEFAULT_AGENT_SETTINGS.temperature,
+        system_prompt=(
+            main_agent.system_prompt or DEFAULT_AGENT_SETTINGS.system_prompt
+        ),
+    )
+    logger.debug(
+        "Using agent settings - model: %s, temperature: %s",
+        agent_settings.model,
+        agent_settings.temperature,
+    )
+    return agent_settings
+
+
+def _build_chat_history(
+    message: schemas.ChatMessageCreate,
+    system_prompt: str,
+    context_messages: List[crud_chat.ContextMessage],
+) -> List[Dict[str, str]]:
+    """채팅 기록을 LLM 형식으로 변환합니다 (메시지 dict 는 한 번의 컴프리헨션으로 생성)."""
+    # 이전 대화 기록 (이미 시간순으로 정렬됨 - created_at.asc())
+    # 시스템 메시지는 시스템 프롬프트로 대체하므로 제외하고, 최신 메시지부터
+    # 누적 길이가 CONTEXT_CHAR_BUDGET 안에 들어오는 것만 사용
+    history = [msg for msg in context_messages if msg.role != ROLE_SYSTEM]
+    kept = sum(
+        1
+        for total in accumulate(len(msg.content) for msg in reversed(history))
+        if total <= CONTEXT_CHAR_BUDGET
+    )
+
+    # 시스템 프롬프트(항상 첫 번째) + 이전 대화 + 현재 사용자 메시지(가장 마지막)
+    prefix = [(ROLE_SYSTEM, system_prompt)] if system_prompt else []
+    chat_history: List[Dict[str, str]] = [
+        {"role": role, "content": content}
+        for role, content in chain(
+            prefix,
+            history[len(history) - kept :],
+            ((message.role, message.content),),
+        )
+    ]
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Chat history prepared: %d messages, roles: %s",
+            len(chat_history),
+            [msg["role"] for msg in chat_history],
+        )
+    return chat_history
+
+
+def _new_chat_title(at: datetime) -> str:
+    """자동 생성 세션 제목 (고정 형식이므로 strftime 대신 필드를 직접 포맷)."""
+    return (
+        f"New Chat {at.year:04d}-{at.month:02d}-{at.day:02d} "
+        f"{at.hour:02d}:{at.minute:02d}"
+    )
+
+
+def _error_reply(error: Exception) -> str:
+    """AI 응답 생성 실패 시 응답으로 저장할 안내 문구."""
+    return f"죄송합니다. 응답을 생성하는 중 오류가 발생했습니다: {str(error)}"
+
+
+async def _generate_assistant_reply(
+    message: schemas.ChatMessageCreate,
+    main_agent: Optional[Agent],
+    context_messages: List[crud_chat.ContextMessage],
+    session_id: UUID,
+) -> str:
+    """
+    사용자 메시지에 대한 AI 응답 본문을 생성합니다.
+
+    응답 생성에 실패하면 예외 대신 사용자에게 보여줄 오류 안내 문구를 반환하므로,
+    호출 측은 항상 사용자 메시지와 응답을 함께 저장할 수 있습니다.
+    """
+    try:
+        agent_settings = _resolve_agent_settings(main_agent)
+        model = agent_settings.model
+        temperature = agent_settings.temperature
+        chat_history = _build_chat_history(
+            message, agent_settings.system_prompt, context_messages
+        )
+
+        # 같은 대화 상태에서 같은 질문이면 캐시된 응답을 재사용 (LLM 호출 생략)
+        cache_key = response_cache.make_key(
+            chat_history,
+            scope=str(DEFAULT_USER_ID),
+            model=model,
+            temperature=temperature,
+        )
+        response_content = response_cache.lookup(cache_key)
+        if response_content is not None:
+            logger.debug("Response cache hit for session: %s", session_id)
+        else:
+            # 공유 LLM 클라이언트 사용 (이미 초기화된 경우 즉시 반환)
+            await llm_client.initialize()
+
+            # shield: 타임아웃이나 클라이언트 연결 종료 시 핸들러는 바로 반환하고,
+            # 진행 중인 LLM 요청은 백그라운드에서 마저 정리되도록 함
+            response_content = await asyncio.wait_for(
+                asyncio.shield(
+                    llm_client.generate_chat_response(
+                        messages=chat_history,
+                        temperature=temperature,
+                        max_tokens=1000,
+                        model=model,
+                    )
+                ),
+                timeout=settings.LLM_RESPONSE_TIMEOUT,
+            )
+            logger.debug(
+                "LLM response generated: %d characters", len(response_content)
+            )
+            # 실패 시 반환되는 안내 문구는 캐시하지 않음
+            if response_content != FALLBACK_RESPONSE:
+                response_cache.store(cache_key, response_content)
+
+        return response_content
+
+    except Exception as e:
+        # 트레이스백은 실제 오류 경로에서만 한 번 기록 (메시지 내용은 남기지 않음)
+        logger.exception("Chat reply generation failed (session: %s)", session_id)
+        # AI 응답 생성 실패 시 에러 메시지를 응답으로 저장
+        return _error_reply(e)
+
+
+async def _persist_assistant_message(
+    session_id: UUID, content: str
+) -> Optional[UUID]:
+    """
+    AI 응답 메시지를 별도의 세션으로 저장합니다 (실패 시 한 번 재시도).
+
+    응답 전송 후 실행될 수 있어 요청 세션은 이미 닫혔을 수 있으므로
+    독립된 세션을 사용합니다.
+
+    Returns:
+        Optional[UUID]: 저장된 메시지 ID (재시도까지 실패하면 None)
+    """
+    # 서버에서 생성한 응답이므로 검증 생략
+    assistant_message = schemas.ChatMessageCreate.model_construct(
+        role=ROLE_ASSISTANT, content=content
+    )
+    for attempt in range(1, PERSIST_ATTEMPTS + 1):
+        try:
+            async with async_session_maker() as persist_db:
+                (db_message,) = await crud_chat.chat_message.create_many_with_session(
+                    persist_db,
+                    objs_in=[assistant_message],
+                    session_id=session_id,
+                    # 사용자 메시지(요청 수신 시각)보다 항상 뒤에 정렬되도록 저장 시각 사용
+                    created_at=utcnow(),
+                )
+                await persist_db.commit()
+            return db_message.id
+        except Exception:
+            logger.exception(
+                "Failed to persist assistant message (session: %s, attempt %d/%d)",
+                session_id,
+                attempt,
+                PERSIST_ATTEMPTS,
+            )
+    return None
+
+
+def _start_persist(session_id: UUID, content: str) -> "asyncio.Task[Optional[UUID]]":
+    """
+    AI 응답 저장을 요청과 독립된 태스크로 시작합니다.
+
+    스트림이 취소되어도 저장이 끝날 때까지 태스크 참조를 유지합니다.
+    """
+    task = asyncio.create_task(_persist_assistant_message(session_id, content))
+    _pending_persists.add(task)
+    task.add_done_callback(_pending_persists.discard)
+    return task
+
+
+async def _persist_user_message(
+    session_id: UUID, message: schemas.ChatMessageCreate, received_at: datetime
+) -> ChatMessage:
+    """
+    사용자 메시지를 별도의 세션으로 저장하고 커밋합니다 (세션이 없으면 생성).
+
+    요청 세션의 컨텍스트 조회, MAIN 에이전트 조회와 asyncio.gather 로 함께
+    실행되므로 저장 왕복이 LLM 호출 앞에 직렬로 붙지 않습니다. 커밋까지
+    마친 뒤 반환하므로 응답 전에 영구 저장되고 다음 대화의 컨텍스트에도
+    포함됩니다.
+    """
+    async with async_session_maker() as persist_db:
+        # 요청한 ID 로 INSERT ... ON CONFLICT 하므로 동시에 들어온 첫 메시지들도
+        # 같은 세션에 저장됨
+        await crud_chat.chat_session.get_or_create(
+            persist_db,
+            id=session_id,
+            obj_in=schemas.ChatSessionCreate(
+                title=_new_chat_title(received_at),
+                user_id=DEFAULT_USER_ID,
+            ),
+        )
+        (db_message,) = await crud_chat.chat_message.create_many_with_session(
+            persist_db, objs_in=[message], session_id=session_id, created_at=received_at
+        )
+        await persist_db.commit()
+    logger.debug("User message saved with ID: %s", db_message.id)
+    return db_message
+
+
+async def _prepare_chat(
+    db: AsyncSession,
+    session_id: UUID,
+    message: schemas.ChatMessageCreate,
+    received_at: datetime,
+) -> Tuple[
+    UUID, List[crud_chat.ContextMessage], Optional[Agent], Optional[ChatMessage]
+]:
+    """
+    채팅 세션을 확인(없으면 생성)하고 컨텍스트 메시지와 MAIN 에이전트를 조회합니다.
+
+    사용자 메시지는 두 조회와 동시에 저장합니다.
+
+    Returns:
+        Tuple[UUID, List[ContextMessage], Optional[Agent], Optional[ChatMessage]]:
+            사용할 세션 ID, 최근 컨텍스트 메시지, MAIN 에이전트와 저장된
+            사용자 메시지 (마지막 둘은 사용자 메시지일 때만)
+    """
+    # 채팅 세션 존재 확인과 컨텍스트용 최근 메시지 조회를 한 번의 쿼리로 처리
+    # (received_at 이전 메시지만 읽으므로 동시에 저장 중인 현재 메시지는 제외됨)
+    session_and_context = crud_chat.chat_session.get_with_recent_messages(
+        db, session_id=session_id, limit=CONTEXT_MESSAGE_LIMIT, before=received_at
+    )
+    if message.role == ROLE_USER:
+        # 서로 독립적인 작업이므로 MAIN 에이전트 조회, 사용자 메시지 저장과 동시에 실행
+        # (세션이 없으면 사용자 메시지 저장 시 생성됨)
+        (_, context_messages), main_agent, db_message = await asyncio.gather(
+            session_and_context,
+            _load_main_agent(),
+            _persist_user_message(session_id, message, received_at),
+        )
+        logger.debug("Main agent found: %s", main_agent is not None)
+        return session_id, context_messages, main_agent, db_message
+
+    db_chat_session, context_messages = await session_and_context
+    if not db_chat_session:
+        # For MVP, create a new session with default user if it doesn't exist.
+        # 요청한 ID 로 INSERT ... ON CONFLICT 하므로 동시에 들어온 첫 메시지들도
+        # 같은 세션에 저장됨 (기존 세션은 위 조회에서 이미 처리되어 추가 왕복 없음)
+        db_chat_session = await crud_chat.chat_session.get_or_create(
+            db,
+            id=session_id,
+            obj_in=schemas.ChatSessionCreate(
+                title=_new_chat_title(received_at),
+                user_id=DEFAULT_USER_ID,
+            ),
+        )
+        logger.info("Chat session ensured: %s", db_chat_session.id)
+    else:
+        logger.debug("Using existing chat session: %s", db_chat_session.id)
+    return session_id, context_messages, None, None
+
+
 @router.post("/{session_id}/messages", response_model=schemas.ChatMessage)
 async def create_chat_message(
     session_id: UUID,
     message: schemas.ChatMessageCreate,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
 ) -> schemas.ChatMessage:
     """
@@ -32,144 +356,159 @@ async def create_chat_message(
     - **role**: 메시지 역할 ('user', 'assistant', 'system')
     - **content**: 메시지 내용
     """
-    logger.info(f"=== Chat message creation started ===")
-    logger.info(f"Session ID: {session_id}")
-    logger.info(f"Message role: {message.role}")
-    logger.info(f"Message content: {message.content}")
-    
-    # 채팅 세션이 존재하는지 확인
-    db_chat_session = await crud_chat.chat_session.get(db, id=session_id)
-    if not db_chat_session:
-        logger.info("Chat session not found, creating new session")
-        # For MVP, create a new session with default user if it doesn't exist
-        db_chat_session = await crud_chat.chat_session.create(
-            db,
-            obj_in=schemas.ChatSessionCreate(
-                title=f"New Chat {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M')}",
-                user_id=DEFAULT_USER_ID,
-            ),
+    # 메시지 내용은 개인정보일 수 있으므로 길이만 기록
+    logger.debug(
+        "Chat message creation started (session: %s, role: %s, length: %d)",
+        session_id,
+        message.role,
+        len(message.content),
+    )
+    # 요청 수신 시각: 사용자 메시지의 created_at 으로 사용
+    received_at = utcnow()
+
+    with stage_timer("chat.prepare"):
+        session_id, context_messages, main_agent, db_message = await _prepare_chat(
+            db, session_id, message, received_at
         )
-        logger.info(f"New chat session created: {db_chat_session.id}")
-        # 새로 생성된 세션의 ID를 사용
-        session_id = db_chat_session.id
-    else:
-        logger.info(f"Using existing chat session: {db_chat_session.id}")
 
-    # 사용자 메시지 저장
-    logger.info("Saving user message to database")
-    db_message = await crud_chat.chat_message.create_with_session(
-        db, obj_in=message, session_id=session_id
+    if db_message is None:
+        # 사용자 메시지가 아니면 AI 응답 없이 저장만 수행
+        db_message = await crud_chat.chat_message.create_with_session(
+            db, obj_in=message, session_id=session_id
+        )
+        logger.debug("Message saved with ID: %s", db_message.id)
+        return db_message
+
+    with stage_timer("chat.reply"):
+        response_content = await _generate_assistant_reply(
+            message, main_agent, context_messages, session_id
+        )
+
+    # AI 응답만 응답을 보낸 뒤 백그라운드에서 저장
+    background_tasks.add_task(
+        _persist_assistant_message, session_id, response_content
     )
-    logger.info(f"User message saved with ID: {db_message.id}")
 
-    # 사용자 메시지인 경우 AI 응답 생성
-    if message.role == "user":
+    return db_message
+
+
+def _sse_event(payload: Dict[str, Any]) -> bytes:
+    """Server-Sent Events 의 data 이벤트 하나를 만듭니다."""
+    # asyncpg 가 돌려주는 UUID 는 uuid.UUID 의 하위 클래스라 orjson 이
+    # 직접 직렬화하지 못하므로 문자열로 변환
+    return b"data: " + orjson.dumps(payload, default=str) + b"\n\n"
+
+
+@router.post("/{session_id}/messages/stream")
+async def stream_chat_message(
+    session_id: UUID,
+    message: schemas.ChatMessageCreate,
+    db: AsyncSession = Depends(get_db),
+) -> StreamingResponse:
+    """
+    사용자 메시지에 대한 AI 응답을 Server-Sent Events 로 스트리밍합니다.
+
+    - 생성되는 토큰마다 `data: {"delta": "..."}` 이벤트를 보냅니다.
+    - 실패 시 `data: {"error": "..."}` 이벤트를 보냅니다.
+    - 사용자 메시지는 스트리밍 전에 저장하고, 끝나면 응답을 저장한 뒤
+      `data: {"done": true, "session_id": ..., "message_id": ...}` 를 보냅니다.
+      응답 저장에 실패하면 `done` 대신 `error` 이벤트를 보냅니다.
+    - 클라이언트 연결이 중간에 끊겨도 그때까지 받은 응답은 저장합니다.
+    """
+    if message.role != ROLE_USER:
+        raise HTTPException(
+            status_code=400, detail="스트리밍은 사용자 메시지만 지원합니다."
+        )
+    logger.debug("Chat message stream started (session: %s)", session_id)
+    received_at = utcnow()
+
+    # 사용자 메시지는 스트리밍 전에 (세션과 함께) 저장·커밋됨
+    # (스트림 종료 시 별도 세션에서 응답을 저장할 수 있고, 연결이 끊겨도 남음)
+    with stage_timer("chat.prepare"):
+        session_id, context_messages, main_agent, _ = await _prepare_chat(
+            db, session_id, message, received_at
+        )
+
+    agent_settings = _resolve_agent_settings(main_agent)
+    chat_history = _build_chat_history(
+        message, agent_settings.system_prompt, context_messages
+    )
+
+    async def event_stream() -> AsyncIterator[bytes]:
+        parts: List[str] = []
+        persist: Optional["asyncio.Task[Optional[UUID]]"] = None
         try:
-            logger.info(f"Processing user message for session: {session_id}")
-            
-            # MAIN 타입 에이전트 설정 가져오기
-            main_agent = await crud_agent.agent.get_main_agent(db, user_id=DEFAULT_USER_ID)
-            logger.info(f"Main agent found: {main_agent is not None}")
-            
-            # 기본값 설정 (MAIN 에이전트가 없는 경우)
-            model = "gpt-3.5-turbo"
-            temperature = 0.7
-            system_prompt = "당신은 도움이 되는 AI 어시스턴트입니다."
-            
-            if main_agent:
-                model = main_agent.model or model
-                temperature = main_agent.temperature or temperature
-                system_prompt = main_agent.system_prompt or system_prompt
-                logger.info(f"Using agent settings - model: {model}, temperature: {temperature}")
-            
-            # 최근 채팅 기록 가져오기 (현재 사용자 메시지 제외)
-            # 컨텍스트용으로 최근 8개 메시지 (4개 대화 쌍 정도)
-            previous_messages = await crud_chat.chat_session.get_messages(
-                db, session_id=session_id, limit=8
-            )
-            
-            # 현재 저장된 사용자 메시지는 제외 (아직 AI 응답이 생성되지 않았으므로)
-            context_messages = [msg for msg in previous_messages if msg.id != db_message.id]
-            logger.info(f"Retrieved {len(context_messages)} previous messages for context")
-            
-            # 채팅 기록을 LLM 형식으로 변환
-            chat_history = []
-            
-            # 1. 시스템 프롬프트 추가 (항상 첫 번째)
-            if system_prompt:
-                chat_history.append({
-                    "role": "system",
-                    "content": system_prompt
-                })
-            
-            # 2. 이전 대화 기록 추가 (시간순으로 정렬)
-            for msg in context_messages:  # 이미 시간순으로 정렬됨 (created_at.asc())
-                if msg.role == "system":
-                    continue  # 시스템 메시지는 이미 추가했으므로 제외
-                chat_history.append({
-                    "role": msg.role,
-                    "content": msg.content
-                })
-            
-            # 3. 현재 사용자 메시지 추가 (가장 마지막)
-            chat_history.append({
-                "role": message.role,
-                "content": message.content
-            })
-            
-            logger.info(f"Chat history prepared: {len(chat_history)} messages")
-            logger.debug(f"Message roles: {[msg['role'] for msg in chat_history]}")
-
-            # LLM 클라이언트 초기화 및 응답 생성
-            llm_client = LLMClient()
-            await llm_client.initialize()
-            logger.info("LLM client initialized")
-            
-            response_content = await llm_client.generate_chat_response(
-                messages=chat_history,
-                temperature=temperature,
-                max_tokens=1000,
-                model=model
-            )
-            logger.info(f"LLM response generated: {len(response_content)} characters")
+            try:
+                async for delta in llm_client.stream_chat_response(
+                    messages=chat_history,
+                    temperature=agent_settings.temperature,
+                    max_tokens=1000,
+                    model=agent_settings.model,
+                ):
+                    parts.append(delta)
+                    yield _sse_event({"delta": delta})
+            except Exception as e:
+                logger.exception("Chat reply stream failed (session: %s)", session_id)
+                parts = [_error_reply(e)]
+                yield _sse_event({"error": parts[0]})
 
-            # AI 응답 메시지 저장
-            assistant_message = schemas.ChatMessageCreate(
-                role="assistant",
-                content=response_content
-            )
-            
-            await crud_chat.chat_message.create_with_session(
-                db, obj_in=assistant_message, session_id=session_id
-            )
-            logger.info("Assistant message saved successfully")
-
-        except Exception as e:
-            logger.error(f"Error in chat message creation: {str(e)}", exc_info=True)
-            # AI 응답 생성 실패 시 에러 메시지 저장
-            error_message = schemas.ChatMessageCreate(
-                role="assistant",
-                content=f"죄송합니다. 응답을 생성하는 중 오류가 발생했습니다: {str(e)}"
-            )
-            
-            await crud_chat.chat_message.create_with_session(
-                db, obj_in=error_message, session_id=session_id
-            )
+            # 응답 스트림이 끝난 뒤 요청 세션과 별개의 세션으로 응답을 저장
+            # (shield: 저장 중 연결이 끊겨 취소되어도 저장은 계속 진행)
+            persist = _start_persist(session_id, "".join(parts))
+            assistant_id = await asyncio.shield(persist)
+        finally:
+            if persist is None and parts:
+                # 클라이언트 연결 종료 등으로 스트림이 중단된 경우 받은 부분까지 저장
+                _start_persist(session_id, "".join(parts))
 
-    return db_message
+        if assistant_id is None:
+            yield _sse_event({"error": "응답을 저장하지 못했습니다."})
+            return
+        yield _sse_event(
+            {
+                "done": True,
+                "session_id": session_id,
+                "message_id": assistant_id,
+            }
+        )
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.get("/{session_id}/messages", response_model=List[schemas.ChatMessage])
 async def get_chat_messages(
     session_id: UUID,
     db: AsyncSession = Depends(get_db),
-    skip: int = 0,
-    limit: int = 100,
+    after: Optional[datetime] = None,
+    after_id: Optional[UUID] = None,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(
+        settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE
+    ),
 ) -> List[schemas.ChatMessage]:
     """
-    채팅 세션의 메시지들을 조회합니다.
+    채팅 세션의 메시지들을 오래된 순으로 조회합니다.
+
+    - **after**, **after_id**: 키셋 커서. 이전 페이지 마지막 메시지의
+      created_at 과 id 를 넘기면 그 다음 메시지부터 조회합니다.
+    - **skip**: 건너뛸 레코드 수 (커서 대신 사용하는 기존 방식)
+    - **limit**: 반환할 최대 레코드 수 (최대 MAX_PAGE_SIZE)
+
+    세션이 없으면 404 를 반환합니다.
     """
-    messages = await crud_chat.chat_session.get_messages(
-        db, session_id=session_id, skip=skip, limit=limit
+    messages = await crud_chat.chat_message.get_multi_by_session(
+        db,
+        session_id=session_id,
+        after=after,
+        after_id=after_id,
+        skip=skip,
+        limit=limit,
     )
+    # 빈 결과일 때만 세션 존재 여부를 확인 (일반적인 조회는 추가 쿼리 없음)
+    if not messages and not await crud_chat.chat_session.exists(db, id=session_id):
+        raise chat_session_not_found()
     return messages
@@ -1,17 +1,24 @@
-from typing import List
+from datetime import datetime
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import DEFAULT_USER_ID, settings
 from app.crud import chat_session, chat_message
 from app.db.session import get_db
 from app.schemas import chat as schemas
 
-# Default user ID for MVP
-DEFAULT_USER_ID = UUID("00000000-0000-0000-0000-000000000000")
+router = APIRouter(default_response_class=ORJSONResponse)
 
-router = APIRouter()
+CHAT_SESSION_NOT_FOUND_DETAIL = "채팅 세션을 찾을 수 없습니다."
+
+
+def chat_session_not_found() -> HTTPException:
+    """404 예외를 생성합니다 (상세 메시지는 모든 엔드포인트에서 동일)."""
+    return HTTPException(status_code=404, detail=CHAT_SESSION_NOT_FOUND_DETAIL)
 
 
 @router.post(
@@ -26,34 +33,44 @@ async def create_chat_session(
     - **title**: 채팅 세션 제목 (기본값: '새 채팅')
     """
     # Use default user ID for MVP
-    chat_session_data = chat_session_in.model_dump()
-    chat_session_data["user_id"] = DEFAULT_USER_ID
-
+    # (FastAPI already validated the body; model_copy does not re-validate)
     db_chat_session = await chat_session.create(
-        db, obj_in=schemas.ChatSessionCreate(**chat_session_data)
+        db, obj_in=chat_session_in.model_copy(update={"user_id": DEFAULT_USER_ID})
     )
-    return schemas.ChatSession.model_validate(db_chat_session)
+    # response_model converts the ORM row (from_attributes) in a single pass
+    return db_chat_session
 
 
 @router.get("", response_model=List[schemas.ChatSession])
 async def list_chat_sessions(
-    skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_db)
-) -> List[schemas.ChatSession]:
+    after: Optional[datetime] = None,
+    after_id: Optional[UUID] = None,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(
+        settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE
+    ),
+    db: AsyncSession = Depends(get_db),
+) -> List[Any]:
     """
-    모든 채팅 세션 목록을 조회합니다 (개발용 - 인증 없음).
+    모든 채팅 세션 목록을 생성 순으로 조회합니다 (개발용 - 인증 없음).
 
-    - **skip**: 건너뛸 레코드 수 (페이징용)
-    - **limit**: 반환할 최대 레코드 수 (페이징용)
+    - **after**, **after_id**: 키셋 커서. 이전 페이지 마지막 세션의
+      created_at 과 id 를 넘기면 그 다음 세션부터 조회합니다.
+    - **skip**: 건너뛸 레코드 수 (커서 대신 사용하는 기존 방식)
+    - **limit**: 반환할 최대 레코드 수 (페이징용, 최대 MAX_PAGE_SIZE)
     """
     # For MVP, return all chat sessions
-    chat_sessions = await chat_session.get_multi(db, skip=skip, limit=limit)
-    return [schemas.ChatSession.model_validate(session) for session in chat_sessions]
+    chat_sessions = await chat_session.get_multi_after(
+        db, after=after, after_id=after_id, skip=skip, limit=limit
+    )
+    # ORM rows are serialized once by FastAPI via response_model (from_attributes)
+    return chat_sessions
 
 
 @router.get("/{session_id}", response_model=schemas.ChatSessionDetail)
 async def get_chat_session(
     session_id: UUID, db: AsyncSession = Depends(get_db)
-) -> schemas.ChatSessionDetail:
+) -> Dict[str, Any]:
     """
     특정 채팅 세션과 해당 메시지들을 조회합니다.
 
@@ -62,21 +79,20 @@ async def get_chat_session(
     # 채팅 세션 조회
     db_chat_session = await chat_session.get(db, id=session_id)
     if not db_chat_session:
-        raise HTTPException(status_code=404, detail="채팅 세션을 찾을 수 없습니다.")
+        raise chat_session_not_found()
 
     # 채팅 메시지 조회
     messages = await chat_message.get_multi_by_session(db, session_id=session_id)
 
-    # Pydantic 모델을 사용하여 응답 생성
-    session_data = schemas.ChatSession.model_validate(db_chat_session)
-
-    # 메시지들을 Pydantic 모델로 변환
-    message_models = [schemas.ChatMessage.model_validate(msg) for msg in messages]
-
-    # ChatSessionDetail 모델 생성
-    return schemas.ChatSessionDetail(
-        **session_data.model_dump(), messages=message_models
-    )
+    # ORM 객체를 그대로 넘겨 response_model 검증(from_attributes)을 한 번만 수행
+    return {
+        "id": db_chat_session.id,
+        "user_id": db_chat_session.user_id,
+        "title": db_chat_session.title,
+        "created_at": db_chat_session.created_at,
+        "updated_at": db_chat_session.updated_at,
+        "messages": messages,
+    }
 
 
 @router.delete("/{session_id}", response_model=schemas.ChatSession)
@@ -90,15 +106,10 @@ async def delete_chat_session(
     # 채팅 세션 존재 여부 확인
     session = await chat_session.get(db, id=session_id)
     if not session:
-        raise HTTPException(status_code=404, detail="Chat session not found")
+        raise chat_session_not_found()
     if session.user_id != DEFAULT_USER_ID:
         raise HTTPException(status_code=403, detail="Not authorized to delete this chat session")
 
-    # 세션과 연결된 모든 메시지 삭제
-    messages = await chat_message.get_multi_by_session(db, session_id=session_id)
-    for message in messages:
-        await chat_message.remove(db, id=message.id)
-
-    # 채팅 세션 삭제
+    # 채팅 세션 삭제 (메시지는 FK 의 ON DELETE CASCADE 로 DB 에서 함께 삭제)
     await chat_session.remove(db, id=session_id)
     return session
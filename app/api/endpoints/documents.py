@@ -1,62 +1,107 @@
+import asyncio
+import hashlib
 import logging
 import os
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
-from uuid import UUID
-
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
-from sqlalchemy import func, select
+from typing import Any, BinaryIO, Dict, Optional, Tuple
+from uuid import UUID, uuid4
+
+from cachetools import TTLCache
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    File,
+    HTTPException,
+    UploadFile,
+    status,
+)
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import DEFAULT_USER_ID, settings
 from app.crud import crud_document
 from app.db.session import get_db
-from app.schemas.document import Document as DocumentSchema
+from app.models.db_models import Document
 from app.schemas.document import DocumentCreate
 
-# Default user ID for MVP
-DEFAULT_USER_ID = UUID("00000000-0000-0000-0000-000000000000")  # Changed to UUID object
-
 # Set up logging
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 # File upload directory configuration
 UPLOAD_DIR = "uploads"
-# Ensure upload directory exists and is writable
+UPLOAD_PATH = Path(UPLOAD_DIR)
+# Size of each read from the uploaded file while copying it to disk
+UPLOAD_CHUNK_SIZE = settings.UPLOAD_CHUNK_BYTES
+# posix_fadvise is not available on Windows or macOS
+_HAS_FADVISE = hasattr(os, "posix_fadvise")
+# The total document count only changes on upload/delete, so it is cached
+# briefly and cleared by those endpoints; a cached total lets list pages skip
+# the COUNT(*) OVER () that has to visit every row
+DOCUMENT_COUNT_CACHE_TTL = 30
+_DOCUMENT_COUNT_KEY = "documents"
+_document_count_cache: "TTLCache[str, int]" = TTLCache(
+    maxsize=1, ttl=DOCUMENT_COUNT_CACHE_TTL
+)
+# Ensure upload directory exists and is writable (checked once at import;
+# os.access avoids creating and deleting a probe file on every worker boot)
 try:
-    upload_path = Path(UPLOAD_DIR)
-    upload_path.mkdir(parents=True, exist_ok=True)
-    # Test if directory is writable
-    test_file = upload_path / ".test"
-    test_file.touch()
-    test_file.unlink()
-    logger.info(f"Upload directory is ready at: {upload_path.absolute()}")
+    UPLOAD_PATH.mkdir(parents=True, exist_ok=True)
+    if not os.access(UPLOAD_PATH, os.W_OK | os.X_OK):
+        raise PermissionError(f"{UPLOAD_PATH.absolute()} is not writable")
+    logger.info(f"Upload directory is ready at: {UPLOAD_PATH.absolute()}")
 except Exception as e:
     logger.error(f"Failed to initialize upload directory: {str(e)}")
     raise RuntimeError(f"Failed to initialize upload directory: {str(e)}")
 
 
+def _copy_to_disk(source: BinaryIO, file_path: Path) -> Tuple[int, str]:
+    """
+    Copy an upload's spooled file to disk in fixed-size chunks.
+
+    Runs in a worker thread: memory use stays bounded by UPLOAD_CHUNK_SIZE
+    regardless of the file's size, and the size and checksum are computed on
+    the same pass instead of re-reading.
+    """
+    file_size = 0
+    hasher = hashlib.blake2b()
+    with open(file_path, "wb") as buffer:
+        while chunk := source.read(UPLOAD_CHUNK_SIZE):
+            buffer.write(chunk)
+            hasher.update(chunk)
+            file_size += len(chunk)
+        if _HAS_FADVISE:
+            # Stored uploads are not read back by this process, so hint the
+            # kernel to write them out and drop them from the page cache
+            # rather than evicting hotter data
+            buffer.flush()
+            os.posix_fadvise(buffer.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+    return file_size, f"blake2b:{hasher.hexdigest()}"
+
+
 async def _save_uploaded_file(
     file: UploadFile, upload_path: Path
-) -> Tuple[bytes, Path]:
-    """Save the uploaded file to disk and return its contents and path."""
+) -> Tuple[int, str, Path]:
+    """Stream the uploaded file to disk and return its size, checksum and path."""
     file_extension = os.path.splitext(file.filename or "")[1]
-    filename = f"{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}{file_extension}"
+    # A random name is unique even for uploads within the same second
+    filename = f"{uuid4().hex}{file_extension}"
     file_path = upload_path / filename
 
     logger.info(f"Starting file upload: {file.filename} (saving as {filename})")
 
     try:
-        contents = await file.read()
-        logger.info(f"Read {len(contents)} bytes from uploaded file")
-
-        with open(file_path, "wb") as buffer:
-            buffer.write(contents)
-        logger.info(f"File saved to {file_path}")
+        # The blocking reads and writes run in one worker thread for the whole
+        # copy (not one hop per chunk) so the event loop keeps serving requests
+        file_size, checksum = await asyncio.to_thread(
+            _copy_to_disk, file.file, file_path
+        )
+        logger.info(f"File saved to {file_path} ({file_size} bytes)")
 
-        return contents, file_path
+        return file_size, checksum, file_path
     except Exception as e:
         if isinstance(e, HTTPException):
             raise
@@ -74,10 +119,16 @@ async def _save_uploaded_file(
 
 
 async def _save_document_to_db(
-    db: AsyncSession, user_id: UUID, file: UploadFile, file_path: Path, file_size: int
-) -> DocumentSchema:
+    db: AsyncSession,
+    user_id: UUID,
+    file: UploadFile,
+    file_path: Path,
+    file_size: int,
+    checksum: Optional[str] = None,
+) -> Document:
     """Save document metadata to the database and return the created document."""
-    document_data = DocumentCreate(
+    # Every field is produced here on the server, so skip re-validating it
+    document_data = DocumentCreate.model_construct(
         user_id=user_id,
         file_name=file.filename or "unknown",
         file_path=str(file_path),
@@ -85,18 +136,18 @@ async def _save_document_to_db(
         file_type=file.content_type or "application/octet-stream",
         status="processing",
         error_message=None,
-        document_metadata=None,
+        document_metadata={"checksum": checksum} if checksum else None,
     )
 
-    logger.debug(f"Document metadata: {document_data.model_dump_json()}")
-    logger.info("Saving document to database...")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Document metadata: %s", document_data.model_dump_json())
 
     try:
+        # One INSERT ... RETURNING; the row comes back with its server defaults
         db_document = await crud_document.document.create(db, obj_in=document_data)
-        await db.flush()
-        await db.refresh(db_document)
         logger.info(f"Document saved to database with ID: {db_document.id}")
-        return DocumentSchema.model_validate(db_document)
+        # Callers only need the row itself (its id), not a validated schema copy
+        return db_document
     except Exception as e:
         error_msg = f"Database error while saving document: {str(e)}"
         logger.error(error_msg, exc_info=True)
@@ -105,6 +156,13 @@ async def _save_document_to_db(
         )
 
 
+def _utc_isoformat(value: datetime) -> str:
+    """Format a timestamp as ISO 8601 in UTC with a "Z" suffix (API format)."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.isoformat() + "Z"
+
+
 def _cleanup_file(file_path: Path) -> None:
     """Clean up the uploaded file if it exists."""
     if file_path and file_path.exists():
@@ -133,22 +191,12 @@ async def upload_document(
             status_code=status.HTTP_400_BAD_REQUEST, detail="No file provided"
         )
 
-    # Ensure upload directory exists
-    upload_path = Path(UPLOAD_DIR)
-    try:
-        upload_path.mkdir(parents=True, exist_ok=True)
-        logger.info(f"Using upload directory: {upload_path.absolute()}")
-    except Exception as e:
-        error_msg = f"Failed to create upload directory: {str(e)}"
-        logger.error(error_msg, exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=error_msg
-        )
-
     file_path: Optional[Path] = None
     try:
-        # Save the uploaded file and get its contents
-        contents, file_path = await _save_uploaded_file(file, upload_path)
+        # Save the uploaded file and get its size and checksum
+        file_size, checksum, file_path = await _save_uploaded_file(
+            file, UPLOAD_PATH
+        )
 
         # Save document metadata to database
         db_document = await _save_document_to_db(
@@ -156,9 +204,12 @@ async def upload_document(
             user_id=user_id,
             file=file,
             file_path=file_path,
-            file_size=len(contents),
+            file_size=file_size,
+            checksum=checksum,
         )
 
+        _document_count_cache.clear()
+
         # Prepare success response
         response_data = {
             "message": "File uploaded and processed successfully",
@@ -184,24 +235,26 @@ async def upload_document(
         # Clean up if there was an error after file was saved but before DB commit
         if file_path and "db_document" not in locals() and file_path.exists():
             _cleanup_file(file_path)
-
-        # Ensure the uploaded file is properly closed
-        if not file.file.closed:
-            await file.close()
-            logger.debug("Uploaded file handle closed")
+        # The uploaded file itself is closed by FastAPI together with the
+        # parsed form once the request finishes
 
 
 @router.get("", response_model=Dict[str, Any])
 async def list_documents(
     skip: Optional[int] = 0,
     limit: Optional[int] = 100,
+    before: Optional[datetime] = None,
+    before_id: Optional[UUID] = None,
     db: AsyncSession = Depends(get_db),
 ) -> Dict[str, Any]:
     """
-    Get a list of all uploaded documents.
+    Get a list of all uploaded documents, newest first.
 
     - **skip**: Number of records to skip (for pagination)
     - **limit**: Maximum number of records to return (for pagination)
+    - **before**, **before_id**: Keyset cursor; pass the `next_before` and
+      `next_before_id` of the previous page to get the next one. Unlike
+      skip, the cost does not grow with the page depth.
     """
     try:
         logger.info(f"Fetching documents (skip={skip}, limit={limit})")
@@ -210,30 +263,48 @@ async def list_documents(
         actual_skip = skip if skip is not None else 0
         actual_limit = limit if limit is not None else 100
 
-        # Get documents from the database using the correct CRUD reference
-        documents = await crud_document.document.get_multi(
-            db=db, skip=actual_skip, limit=actual_limit
-        )
-
-        # Format the response according to the API spec
+        total_count = _document_count_cache.get(_DOCUMENT_COUNT_KEY)
+        if total_count is None and before is None:
+            # Get the page and the total count in one query (COUNT(*) OVER ())
+            (
+                documents,
+                total_count,
+            ) = await crud_document.document.get_summaries_with_total(
+                db=db, skip=actual_skip, limit=actual_limit
+            )
+            _document_count_cache[_DOCUMENT_COUNT_KEY] = total_count
+        else:
+            documents = await crud_document.document.get_summaries(
+                db=db,
+                before=before,
+                before_id=before_id,
+                skip=actual_skip,
+                limit=actual_limit,
+            )
+            if total_count is None:
+                # A window count after a cursor would only count later rows
+                total_count = await crud_document.document.count(db=db)
+                _document_count_cache[_DOCUMENT_COUNT_KEY] = total_count
+
+        # Format the response according to the API spec; UUIDs are left to the
+        # response serializer, timestamps keep the ISO 8601 "Z" format
         formatted_documents = [
             {
-                "id": str(doc.id),
+                "id": doc.id,
                 "filename": doc.file_name,
                 "file_size": doc.file_size,
                 "file_type": doc.file_type,
                 "status": doc.status,
-                "uploaded_at": doc.created_at.isoformat()
-                + "Z",  # ISO 8601 format with Z for UTC
+                "uploaded_at": _utc_isoformat(doc.created_at),
             }
             for doc in documents
         ]
 
-        # Get total count using SQLAlchemy directly
-        from app.models.db_models import Document
-
-        count_result = await db.execute(select(func.count()).select_from(Document))
-        total_count = count_result.scalar_one()
+        if before is None:
+            has_more = (actual_skip + len(formatted_documents)) < total_count
+        else:
+            has_more = len(formatted_documents) == actual_limit
+        last = documents[-1] if documents else None
 
         return {
             "documents": formatted_documents,
@@ -241,7 +312,9 @@ async def list_documents(
                 "total": total_count,
                 "skip": actual_skip,
                 "limit": actual_limit,
-                "has_more": (actual_skip + len(formatted_documents)) < total_count,
+                "has_more": has_more,
+                "next_before": _utc_isoformat(last.created_at) if last else None,
+                "next_before_id": last.id if last else None,
             },
         }
 
@@ -276,13 +349,13 @@ async def get_document(
 
         # Format the response according to the API spec
         response_data = {
-            "id": str(document.id),
+            "id": document.id,
             "filename": document.file_name,
             "file_path": document.file_path,
             "file_size": document.file_size,
             "file_type": document.file_type,
             "status": document.status,
-            "uploaded_at": document.created_at.isoformat() + "Z",
+            "uploaded_at": _utc_isoformat(document.created_at),
             # Convert metadata to dict if it's not already
             "metadata": (
                 dict(document.document_metadata) if document.document_metadata else {}
@@ -306,40 +379,37 @@ async def get_document(
 
 @router.delete("/{document_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_document(
-    document_id: UUID, db: AsyncSession = Depends(get_db)
+    document_id: UUID,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
 ) -> None:
     """
     Delete a document from the knowledge base.
 
     - **document_id**: ID of the document to delete (UUID string)
     """
-    db_document: Optional[DocumentSchema] = None
     try:
         logger.info(f"Deleting document with ID: {document_id}")
 
-        # Get the document from the database first
-        db_document = await crud_document.document.get(db=db, id=document_id)
+        # Delete the row and get its file path in one DELETE ... RETURNING
+        file_path = await crud_document.document.remove_returning_path(
+            db=db, id=document_id
+        )
 
         # Check if document exists
-        if not db_document:
+        if file_path is None:
             error_msg = f"Document not found with ID: {document_id}"
             logger.warning(error_msg)
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=error_msg)
 
-        file_path = Path(db_document.file_path)
-
-        # Delete the file from storage if it exists
-        if file_path and file_path.exists():
-            try:
-                os.remove(file_path)
-                logger.info(f"Successfully deleted file: {file_path}")
-            except Exception as e:
-                # Log the error but continue with DB deletion
-                error_msg = f"Warning: Could not delete file {file_path}: {str(e)}"
-                logger.warning(error_msg, exc_info=True)
+        # Commit before scheduling the file removal so the file is only
+        # removed once the row is gone
+        await db.commit()
+        _document_count_cache.clear()
 
-        # Delete the document from the database
-        await crud_document.document.remove(db=db, id=document_id)
+        # The row is the source of truth, so the file is removed after the
+        # response is sent (errors are logged by _cleanup_file)
+        background_tasks.add_task(_cleanup_file, Path(file_path))
 
         logger.info(f"Successfully deleted document with ID: {document_id}")
         return None
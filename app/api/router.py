@@ -1,12 +1,13 @@
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
 
 from .endpoints.agents import router as agents_router
 from .endpoints.chat import router as chat_router
 from .endpoints.chat_sessions import router as chat_sessions_router
 from .endpoints.documents import router as documents_router
 
-# Create main API router
-api_router = APIRouter()
+# Create main API router (responses are serialized with orjson)
+api_router = APIRouter(default_response_class=ORJSONResponse)
 
 # Include all API routes with their respective prefixes and tags
 api_router.include_router(agents_router, prefix="/agents", tags=["Agents"])
@@ -1,5 +1,6 @@
 import os
 from typing import List, Optional
+from uuid import UUID
 
 from pydantic import PostgresDsn, ValidationInfo, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -23,6 +24,16 @@ class Settings(BaseSettings):
     POSTGRES_PORT: str = os.getenv("POSTGRES_PORT", "5432")
     DATABASE_URI: Optional[PostgresDsn] = None
 
+    # Database connection pool (per worker process)
+    DB_ECHO: bool = os.getenv("DB_ECHO", "false").lower() == "true"
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "20"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    DB_POOL_TIMEOUT: int = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    # Set when connecting through PgBouncer (transaction mode): the bouncer owns
+    # pooling, so the app uses NullPool and disables asyncpg statement caches
+    DB_USE_PGBOUNCER: bool = os.getenv("DB_USE_PGBOUNCER", "false").lower() == "true"
+
     # ChromaDB Configuration
     CHROMA_DB_PATH: str = os.getenv("CHROMA_DB_PATH", "./chroma_db")
 
@@ -42,9 +53,20 @@ class Settings(BaseSettings):
     )
     OPENROUTER_MODEL: str = os.getenv("OPENROUTER_MODEL", "google/gemma-3-27b-it:free")
 
+    # Upper bound (seconds) a chat request waits for the LLM response
+    LLM_RESPONSE_TIMEOUT: float = float(os.getenv("LLM_RESPONSE_TIMEOUT", "30"))
+
     # CORS
     BACKEND_CORS_ORIGINS: List[str] = ["*"]
 
+    # Pagination
+    DEFAULT_PAGE_SIZE: int = 100
+    MAX_PAGE_SIZE: int = 500
+
+    # Bytes per read/write while copying an upload to disk (4 MiB); larger
+    # chunks mean fewer syscalls per upload at the cost of memory per upload
+    UPLOAD_CHUNK_BYTES: int = int(os.getenv("UPLOAD_CHUNK_BYTES", str(4 << 20)))
+
     # Token expiration for security
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30  # Default to 30 minutes
 
@@ -86,3 +108,6 @@ class Settings(BaseSettings):
 
 # Initialize settings
 settings: "Settings" = Settings()  # type: ignore
+
+# Default user ID for MVP (the system user seeded by the alembic migrations)
+DEFAULT_USER_ID = UUID("00000000-0000-0000-0000-000000000000")
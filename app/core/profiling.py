@@ -0,0 +1,27 @@
+import logging
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Iterator
+
+logger = logging.getLogger(__name__)
+
+
+@contextmanager
+def stage_timer(stage: str) -> Iterator[None]:
+    """
+    블록의 경과 시간(대기한 await 포함)을 DEBUG 로그로 남깁니다.
+
+    요청 처리 중 어느 단계(DB 조회, LLM 호출 등)가 지연을 차지하는지
+    확인하기 위한 용도이며, DEBUG 가 꺼져 있으면 시간을 재지 않습니다.
+
+    Args:
+        stage: 로그에 표시할 단계 이름 (예: "chat.llm")
+    """
+    if not logger.isEnabledFor(logging.DEBUG):
+        yield
+        return
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        logger.debug("stage %s took %.1f ms", stage, (perf_counter() - start) * 1000)
@@ -1,30 +1,64 @@
-from datetime import datetime, timedelta
-from typing import Optional
+import base64
+import hashlib
+import hmac
+from datetime import timedelta
+from functools import lru_cache
+from typing import Any, Dict, Optional
 
+import orjson
 from jose import jwt
 from passlib.context import CryptContext
 
 from app.core.config import settings
+from app.core.timeutils import utcnow
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+@lru_cache(maxsize=None)
+def get_pwd_context() -> CryptContext:
+    """Build the password hashing context on first use and reuse it."""
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
 def get_password_hash(password: str) -> str:
-    return str(pwd_context.hash(password))
+    return str(get_pwd_context().hash(password))
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return bool(pwd_context.verify(plain_password, hashed_password))
+    return bool(get_pwd_context().verify(plain_password, hashed_password))
+
+
+def _b64url(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+# The HS256 JOSE header never changes, so it is encoded once
+_HS256_HEADER_SEGMENT = _b64url(b'{"alg":"HS256","typ":"JWT"}')
+
+
+@lru_cache(maxsize=None)
+def _get_hs256_signer() -> "hmac.HMAC":
+    """HMAC-SHA256 keyed with SECRET_KEY once; copied for each token."""
+    return hmac.new(settings.SECRET_KEY.encode(), digestmod=hashlib.sha256)
+
+
+def _encode_hs256(claims: Dict[str, Any]) -> str:
+    """Encode and sign claims as an HS256 JWT (compatible with jose.jwt)."""
+    signing_input = _HS256_HEADER_SEGMENT + b"." + _b64url(orjson.dumps(claims))
+    signer = _get_hs256_signer().copy()
+    signer.update(signing_input)
+    return (signing_input + b"." + _b64url(signer.digest())).decode("ascii")
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
+    now = utcnow()
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = now + expires_delta
     else:
-        expire = datetime.utcnow() + timedelta(
-            minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-        )
+        expire = now + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    if settings.ALGORITHM == "HS256":
+        to_encode["exp"] = int(expire.timestamp())
+        return _encode_hs256(to_encode)
     to_encode.update({"exp": expire})
     encoded_jwt = jwt.encode(
         to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM
@@ -0,0 +1,17 @@
+from datetime import datetime, timezone
+
+# Bound once so callers don't re-resolve timezone.utc on every call
+UTC = timezone.utc
+
+
+def utcnow() -> datetime:
+    """
+    현재 UTC 시각을 timezone-aware datetime으로 반환합니다.
+
+    datetime.utcnow()는 naive datetime을 반환하며 deprecated 되었으므로
+    타임스탬프가 필요한 곳에서는 이 함수를 사용합니다.
+
+    Returns:
+        datetime: tzinfo가 UTC로 설정된 현재 시각
+    """
+    return datetime.now(UTC)
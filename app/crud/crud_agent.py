@@ -1,6 +1,8 @@
-from typing import List, Optional
+from typing import List, Optional, Type
 from uuid import UUID
 
+from cachetools import TTLCache
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
@@ -9,8 +11,19 @@ from app.schemas.agent import AgentCreate, AgentUpdate
 
 from .base import CRUDBase
 
+# MAIN 에이전트는 채팅 요청마다 조회되지만 거의 바뀌지 않으므로 사용자별로 캐시합니다.
+# 에이전트 생성·수정·삭제 시 전체 무효화 (다른 워커는 TTL 이 지나면 반영)
+MAIN_AGENT_CACHE_TTL = 60
+_MISSING = object()
+
 
 class CRUDAgent(CRUDBase[Agent, AgentCreate, AgentUpdate]):
+    def __init__(self, model: Type[Agent]):
+        super().__init__(model)
+        self._main_agent_cache: "TTLCache[UUID, Optional[Agent]]" = TTLCache(
+            maxsize=1024, ttl=MAIN_AGENT_CACHE_TTL
+        )
+
     async def get_by_name(self, db: AsyncSession, *, user_id: UUID, name: str) -> Optional[Agent]:
         result = await db.execute(
             select(self.model).filter(
@@ -20,15 +33,46 @@ class CRUDAgent(CRUDBase[Agent, AgentCreate, AgentUpdate]):
         )
         return result.scalars().first()
 
+    async def create_unique_name(
+        self, db: AsyncSession, *, obj_in: AgentCreate
+    ) -> Optional[Agent]:
+        """
+        에이전트를 생성하되, 같은 사용자에게 동일한 이름이 이미 있으면 None을 반환합니다.
+
+        (user_id, name) 유니크 인덱스에 대한 INSERT ... ON CONFLICT DO NOTHING
+        RETURNING 한 번으로 중복 확인과 생성을 처리합니다.
+        """
+        result = await db.execute(
+            insert(self.model)
+            .values(**obj_in.model_dump())
+            .on_conflict_do_nothing(index_elements=["user_id", "name"])
+            .returning(self.model)
+        )
+        return result.scalars().first()
+
     async def get_main_agent(self, db: AsyncSession, *, user_id: UUID) -> Optional[Agent]:
-        """MAIN 타입의 에이전트를 가져옵니다."""
+        """
+        MAIN 타입의 에이전트를 가져옵니다.
+
+        결과(없는 경우 포함)는 MAIN_AGENT_CACHE_TTL 동안 캐시되며, 캐시된
+        객체는 세션에서 분리된 상태이므로 읽기 전용으로만 사용해야 합니다.
+        """
+        cached = self._main_agent_cache.get(user_id, _MISSING)
+        if cached is not _MISSING:
+            return cached
         result = await db.execute(
             select(self.model).filter(
                 self.model.user_id == user_id,
                 self.model.agent_type == "MAIN"
             )
         )
-        return result.scalars().first()
+        main_agent = result.scalars().first()
+        self._main_agent_cache[user_id] = main_agent
+        return main_agent
+
+    def clear_main_agent_cache(self) -> None:
+        """MAIN 에이전트 캐시를 비웁니다 (에이전트가 변경되었을 때 호출)."""
+        self._main_agent_cache.clear()
 
     async def get_multi_by_type(
         self, db: AsyncSession, *, agent_type: str, skip: int = 0, limit: int = 100
@@ -1,6 +1,10 @@
-from typing import List, Optional
+from datetime import datetime, timedelta
+from typing import List, NamedTuple, Optional, Sequence, Tuple
 from uuid import UUID
 
+from sqlalchemy import func, insert, literal, true, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.sql import Select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
@@ -15,6 +19,29 @@ from app.schemas.chat import (
 from .base import CRUDBase
 
 
+class ContextMessage(NamedTuple):
+    """LLM 컨텍스트에 필요한 메시지 필드만 담은 읽기 전용 행."""
+
+    role: str
+    content: str
+
+
+def _after_cursor(
+    stmt: Select, model: type, after: Optional[datetime], after_id: Optional[UUID]
+) -> Select:
+    """
+    (created_at, id) 키셋 커서 조건을 추가합니다.
+
+    OFFSET 과 달리 앞쪽 행을 읽고 버리지 않으므로 페이지 깊이와 무관하게
+    (created_at, id) 인덱스 범위 스캔으로 처리됩니다.
+    """
+    if after is None:
+        return stmt
+    if after_id is None:
+        return stmt.where(model.created_at > after)
+    return stmt.where(tuple_(model.created_at, model.id) > tuple_(after, after_id))
+
+
 class CRUDChatSession(CRUDBase[ChatSession, ChatSessionCreate, ChatSessionUpdate]):
     async def get_messages(
         self, db: AsyncSession, *, session_id: UUID, skip: int = 0, limit: int = 100
@@ -28,6 +55,132 @@ class CRUDChatSession(CRUDBase[ChatSession, ChatSessionCreate, ChatSessionUpdate
         )
         return list(result.scalars().all())
 
+    async def exists(self, db: AsyncSession, *, id: UUID) -> bool:
+        """
+        채팅 세션 존재 여부만 확인합니다 (ORM 객체를 만들지 않음).
+
+        Args:
+            db: 데이터베이스 세션
+            id: 채팅 세션 ID
+
+        Returns:
+            bool: 세션이 있으면 True
+        """
+        found = await db.scalar(
+            select(literal(1)).where(self.model.id == id).limit(1)
+        )
+        return found is not None
+
+    async def get_or_create(
+        self, db: AsyncSession, *, id: UUID, obj_in: ChatSessionCreate
+    ) -> ChatSession:
+        """
+        주어진 ID 의 채팅 세션을 반환하고, 없으면 생성합니다.
+
+        INSERT ... ON CONFLICT (id) DO UPDATE ... RETURNING 한 번으로 처리하므로
+        동시에 들어온 첫 메시지들도 같은 세션을 사용합니다.
+
+        Args:
+            db: 데이터베이스 세션
+            id: 채팅 세션 ID
+            obj_in: 세션이 없을 때 사용할 생성 데이터
+
+        Returns:
+            ChatSession: 기존 또는 새로 생성된 채팅 세션
+        """
+        stmt = (
+            pg_insert(self.model)
+            .values(id=id, **obj_in.model_dump())
+            .on_conflict_do_update(
+                index_elements=[self.model.id], set_={"updated_at": func.now()}
+            )
+            .returning(self.model)
+        )
+        result = await db.scalars(
+            stmt, execution_options={"populate_existing": True}
+        )
+        return result.one()
+
+    async def get_with_recent_messages(
+        self,
+        db: AsyncSession,
+        *,
+        session_id: UUID,
+        limit: int = 8,
+        before: Optional[datetime] = None,
+    ) -> Tuple[Optional[ChatSession], List[ContextMessage]]:
+        """
+        채팅 세션과 최근 메시지들을 한 번의 쿼리로 조회합니다.
+
+        LATERAL 서브쿼리로 세션별 최근 `limit`개 메시지만 조인하므로
+        세션 존재 확인과 컨텍스트 메시지 조회가 하나의 왕복으로 처리됩니다.
+        메시지는 LLM 에 필요한 role/content 컬럼만 읽고 ORM 객체로 만들지
+        않습니다 (metadata JSONB 등은 가져오지 않음).
+
+        Args:
+            db: 데이터베이스 세션
+            session_id: 조회할 채팅 세션 ID
+            limit: 가져올 최근 메시지 수
+            before: 이 시각 이전에 생성된 메시지만 조회 (없으면 전체)
+
+        Returns:
+            Tuple[Optional[ChatSession], List[ContextMessage]]:
+                채팅 세션(없으면 None)과 시간순으로 정렬된 최근 메시지 목록
+        """
+        recent_query = (
+            select(ChatMessage.role, ChatMessage.content, ChatMessage.created_at)
+            .where(ChatMessage.session_id == self.model.id)
+            .order_by(ChatMessage.created_at.desc())
+            .limit(limit)
+        )
+        if before is not None:
+            recent_query = recent_query.where(ChatMessage.created_at < before)
+        recent = recent_query.lateral()
+        result = await db.execute(
+            select(self.model, recent.c.role, recent.c.content)
+            .outerjoin(recent, true())
+            .where(self.model.id == session_id)
+            .order_by(recent.c.created_at.asc())
+        )
+        rows = result.all()
+        if not rows:
+            return None, []
+        return rows[0][0], [
+            ContextMessage(role, content)
+            for _, role, content in rows
+            if role is not None
+        ]
+
+    async def get_multi_after(
+        self,
+        db: AsyncSession,
+        *,
+        after: Optional[datetime] = None,
+        after_id: Optional[UUID] = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> List[ChatSession]:
+        """
+        채팅 세션 목록을 생성 시각 순으로 조회합니다.
+
+        Args:
+            db: 데이터베이스 세션
+            after: 이 시각 이후에 생성된 세션만 조회 (이전 페이지 마지막 항목의 created_at)
+            after_id: after 와 같은 시각일 때 비교할 ID (이전 페이지 마지막 항목의 id)
+            skip: 건너뛸 레코드 수 (커서 없이 사용하는 기존 방식)
+            limit: 반환할 최대 레코드 수
+
+        Returns:
+            List[ChatSession]: (created_at, id) 오름차순으로 정렬된 세션 목록
+        """
+        stmt = _after_cursor(select(self.model), self.model, after, after_id)
+        result = await db.execute(
+            stmt.order_by(self.model.created_at.asc(), self.model.id.asc())
+            .offset(skip)
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
     async def get_by_title(
         self, db: AsyncSession, *, title: str
     ) -> Optional[ChatSession]:
@@ -43,7 +196,7 @@ class CRUDChatMessage(CRUDBase[ChatMessage, ChatMessageCreate, ChatMessageUpdate
     ) -> ChatMessage:
         # Create model - let the database handle the timestamps
         db_obj = ChatMessage(
-            **obj_in.dict(exclude={"created_at", "updated_at"}, exclude_unset=True),
+            **obj_in.model_dump(exclude={"created_at", "updated_at"}, exclude_unset=True),
             session_id=session_id,
         )
 
@@ -52,8 +205,53 @@ class CRUDChatMessage(CRUDBase[ChatMessage, ChatMessageCreate, ChatMessageUpdate
         await db.refresh(db_obj)
         return db_obj
 
+    async def create_many_with_session(
+        self,
+        db: AsyncSession,
+        *,
+        objs_in: Sequence[ChatMessageCreate],
+        session_id: UUID,
+        created_at: datetime,
+    ) -> List[ChatMessage]:
+        """
+        여러 채팅 메시지를 한 번의 INSERT ... RETURNING 으로 저장합니다.
+
+        같은 트랜잭션 안에서는 now() 값이 동일하므로, 순서가 보장되도록
+        created_at 을 명시하고 메시지마다 1마이크로초씩 증가시킵니다.
+
+        Args:
+            db: 데이터베이스 세션
+            objs_in: 저장할 메시지 목록 (저장 순서대로)
+            session_id: 메시지가 속한 채팅 세션 ID
+            created_at: 첫 번째 메시지의 생성 시각
+
+        Returns:
+            List[ChatMessage]: 입력 순서대로 저장된 채팅 메시지 목록
+        """
+        rows = [
+            {
+                **obj_in.model_dump(exclude_unset=True),
+                "session_id": session_id,
+                "created_at": created_at + timedelta(microseconds=offset),
+                "updated_at": created_at + timedelta(microseconds=offset),
+            }
+            for offset, obj_in in enumerate(objs_in)
+        ]
+        result = await db.execute(
+            insert(self.model).returning(self.model, sort_by_parameter_order=True),
+            rows,
+        )
+        return list(result.scalars().all())
+
     async def get_multi_by_session(
-        self, db: AsyncSession, *, session_id: UUID, skip: int = 0, limit: int = 100
+        self,
+        db: AsyncSession,
+        *,
+        session_id: UUID,
+        after: Optional[datetime] = None,
+        after_id: Optional[UUID] = None,
+        skip: int = 0,
+        limit: int = 100,
     ) -> List[ChatMessage]:
         """
         특정 세션의 채팅 메시지 목록을 조회합니다.
@@ -61,16 +259,22 @@ class CRUDChatMessage(CRUDBase[ChatMessage, ChatMessageCreate, ChatMessageUpdate
         Args:
             db: 데이터베이스 세션
             session_id: 조회할 채팅 세션 ID
-            skip: 건너뛸 레코드 수
+            after: 이 시각 이후의 메시지만 조회 (이전 페이지 마지막 항목의 created_at)
+            after_id: after 와 같은 시각일 때 비교할 ID (이전 페이지 마지막 항목의 id)
+            skip: 건너뛸 레코드 수 (커서 없이 사용하는 기존 방식)
             limit: 반환할 최대 레코드 수
 
         Returns:
-            List[ChatMessage]: 조회된 채팅 메시지 목록
+            List[ChatMessage]: (created_at, id) 오름차순으로 정렬된 메시지 목록
         """
+        stmt = _after_cursor(
+            select(self.model).where(self.model.session_id == session_id),
+            self.model,
+            after,
+            after_id,
+        )
         stmt = (
-            select(self.model)
-            .where(self.model.session_id == session_id)
-            .order_by(self.model.created_at.asc())
+            stmt.order_by(self.model.created_at.asc(), self.model.id.asc())
             .offset(skip)
             .limit(limit)
         )
@@ -1,7 +1,10 @@
-from typing import List, Optional
-from uuid import UUID
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
+from uuid import UUID, uuid4
 
-from sqlalchemy import or_, select
+import orjson
+from sqlalchemy import Row, delete, func, insert, or_, select, tuple_
+from sqlalchemy.sql import Select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.db_models import Document
@@ -9,6 +12,51 @@ from app.schemas.document import DocumentCreate, DocumentUpdate
 
 from .base import CRUDBase
 
+# Columns written by copy_many's COPY; created_at/updated_at are left to
+# their server defaults
+_COPY_COLUMNS = (
+    "id",
+    "user_id",
+    "file_name",
+    "file_path",
+    "file_size",
+    "file_type",
+    "status",
+    "error_message",
+    "metadata",
+)
+
+# Columns the document list needs; selecting only these skips loading
+# file_path and the JSONB metadata and building ORM objects for each row
+SUMMARY_COLUMNS = (
+    Document.id,
+    Document.file_name,
+    Document.file_size,
+    Document.file_type,
+    Document.status,
+    Document.created_at,
+)
+# Newest first; served by a backward scan of ix_documents_created_at_id
+_NEWEST_FIRST = (Document.created_at.desc(), Document.id.desc())
+
+
+def _before_cursor(
+    stmt: Select, before: Optional[datetime], before_id: Optional[UUID]
+) -> Select:
+    """
+    Restrict a newest-first query to rows after a (created_at, id) cursor.
+
+    Unlike OFFSET, the skipped rows are never read, so a page costs the same
+    at any depth.
+    """
+    if before is None:
+        return stmt
+    if before_id is None:
+        return stmt.where(Document.created_at < before)
+    return stmt.where(
+        tuple_(Document.created_at, Document.id) < tuple_(before, before_id)
+    )
+
 
 class CRUDDocument(CRUDBase[Document, DocumentCreate, DocumentUpdate]):
     def __init__(self) -> None:
@@ -22,6 +70,120 @@ class CRUDDocument(CRUDBase[Document, DocumentCreate, DocumentUpdate]):
         )
         return result.scalars().first()
 
+    async def create(self, db: AsyncSession, *, obj_in: DocumentCreate) -> Document:
+        """
+        Insert a document with INSERT ... RETURNING.
+
+        The returned row already carries the server defaults (created_at,
+        updated_at), so no flush + refresh SELECT is needed.
+        """
+        result = await db.execute(
+            insert(self.model).returning(self.model), [obj_in.model_dump()]
+        )
+        return result.scalars().one()
+
+    async def copy_many(
+        self, db: AsyncSession, *, objs_in: Sequence[DocumentCreate]
+    ) -> List[UUID]:
+        """
+        Bulk-insert documents with COPY (asyncpg's binary copy protocol).
+
+        Meant for large imports and backfills, where COPY is cheaper than
+        even a batched INSERT. Runs on the session's connection, so it is
+        part of the session's transaction. Returns the generated ids in input
+        order.
+        """
+        ids = [uuid4() for _ in objs_in]
+        records = [
+            (
+                document_id,
+                obj_in.user_id,
+                obj_in.file_name,
+                obj_in.file_path,
+                obj_in.file_size,
+                obj_in.file_type,
+                obj_in.status,
+                obj_in.error_message,
+                # asyncpg sends jsonb as text
+                (
+                    orjson.dumps(obj_in.document_metadata).decode()
+                    if obj_in.document_metadata is not None
+                    else None
+                ),
+            )
+            for document_id, obj_in in zip(ids, objs_in)
+        ]
+        connection = await db.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            self.model.__tablename__, records=records, columns=_COPY_COLUMNS
+        )
+        return ids
+
+    async def remove_returning_path(
+        self, db: AsyncSession, *, id: UUID
+    ) -> Optional[str]:
+        """
+        Delete a document with DELETE ... RETURNING and return its file path.
+
+        Returns None when no such document exists, so the existence check
+        and the delete take a single round trip.
+        """
+        return await db.scalar(
+            delete(self.model)
+            .where(self.model.id == id)
+            .returning(self.model.file_path)
+        )
+
+    async def count(self, db: AsyncSession) -> int:
+        """Return the total number of documents."""
+        total = await db.scalar(select(func.count()).select_from(self.model))
+        return total or 0
+
+    async def get_summaries(
+        self,
+        db: AsyncSession,
+        *,
+        before: Optional[datetime] = None,
+        before_id: Optional[UUID] = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> List[Row]:
+        """
+        Return a page of documents, newest first, as rows of SUMMARY_COLUMNS.
+
+        before/before_id are the created_at and id of the last document on
+        the previous page (keyset cursor); skip is the older offset paging.
+        """
+        stmt = _before_cursor(select(*SUMMARY_COLUMNS), before, before_id)
+        result = await db.execute(
+            stmt.order_by(*_NEWEST_FIRST).offset(skip).limit(limit)
+        )
+        return list(result.all())
+
+    async def get_summaries_with_total(
+        self, db: AsyncSession, *, skip: int = 0, limit: int = 100
+    ) -> Tuple[List[Row], int]:
+        """
+        Return a page of document summaries (newest first) and the total count.
+
+        The total comes from COUNT(*) OVER () on the same query, so a page
+        costs one round trip. Only a page past the end (no rows to carry the
+        window value) falls back to a separate count.
+        """
+        result = await db.execute(
+            select(*SUMMARY_COLUMNS, func.count().over().label("total"))
+            .order_by(*_NEWEST_FIRST)
+            .offset(skip)
+            .limit(limit)
+        )
+        rows = list(result.all())
+        if rows:
+            return rows, rows[0].total
+        if skip == 0:
+            return [], 0
+        return [], await self.count(db)
+
     async def get_multi_by_owner(
         self, db: AsyncSession, *, user_id: str, skip: int = 0, limit: int = 100
     ) -> List[Document]:
@@ -1,14 +1,20 @@
 import logging
-from typing import AsyncGenerator, Generator
+from functools import lru_cache
+from typing import Generator
 
+from sqlalchemy import Engine as SyncEngine
 from sqlalchemy import create_engine
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
-from sqlalchemy.pool import NullPool
 
 from app.core.config import settings
 
+# The application's engine, session factory and dependency live in
+# app.db.session; they are re-exported here so every importer shares one
+# connection pool (importing this module for Base must not open another)
+from app.db.session import async_engine, async_session_maker, get_db  # noqa: F401
+
 
 def get_async_db_url(sync_url: str) -> str:
     """Convert a synchronous PostgreSQL URL to an async one."""
@@ -20,42 +26,19 @@ def get_async_db_url(sync_url: str) -> str:
     return url_str
 
 
-# Create async engine with thread safety
-async_engine = create_async_engine(
-    get_async_db_url(str(settings.DATABASE_URI)),
-    echo=settings.DEBUG,
-    pool_pre_ping=True,
-    pool_recycle=3600,
-    pool_size=5,
-    max_overflow=10,
-    poolclass=NullPool if settings.TESTING else None,
-    connect_args=(
-        {"check_same_thread": False} if settings.TESTING else {}
-    ),  # SQLite thread safety fix
-)
-
-# Create async session factory
-async_session_maker = async_sessionmaker(
-    bind=async_engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autoflush=False,
-    autocommit=False,
-    future=True,  # SQLAlchemy 2.0 future compatibility
-)
-
-# Create sync engine for migrations
-sync_engine = create_engine(
-    str(settings.DATABASE_URI).replace("+asyncpg", ""),
-    pool_pre_ping=True,
-)
-
-# Create sync session factory
-SessionLocal = sessionmaker(
-    autocommit=False,
-    autoflush=False,
-    bind=sync_engine,
-)
+@lru_cache(maxsize=1)
+def get_sync_engine() -> SyncEngine:
+    """Create the sync engine (for migrations/testing) on first use only."""
+    return create_engine(
+        str(settings.DATABASE_URI).replace("+asyncpg", ""),
+        pool_pre_ping=True,
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_sync_session_maker() -> sessionmaker:
+    return sessionmaker(autocommit=False, autoflush=False, bind=get_sync_engine())
+
 
 # Base class for all models
 Base = declarative_base()
@@ -89,29 +72,12 @@ class SessionManager:
         await self.session.close()
 
 
-# Async session dependency
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """
-    Dependency function that yields database sessions.
-    Handles session lifecycle and ensures proper cleanup.
-    """
-    async with async_session_maker() as session:
-        try:
-            yield session
-            await session.commit()
-        except Exception as e:
-            await session.rollback()
-            logger = logging.getLogger(__name__)
-            logger.error(f"Database error: {str(e)}")
-            raise
-
-
 # Sync session for migrations and testing
 def get_sync_db() -> Generator[Session, None, None]:
     """
     Synchronous database session for migrations and testing.
     """
-    db = SessionLocal()
+    db = _get_sync_session_maker()()
     try:
         yield db
         db.commit()
@@ -1,10 +1,4 @@
-from typing import AsyncGenerator
-
-from sqlalchemy import create_engine
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import sessionmaker
-
-from app.core.config import settings
+from app.db.session import async_engine, async_session_maker, get_db  # noqa: F401
 from app.models.db_models import Agent, Base
 
 
@@ -16,33 +10,6 @@ def get_async_db_url(sync_url: str) -> str:
     return url_str
 
 
-# Create async engine and sessionmaker
-db_url = str(settings.DATABASE_URI) if settings.DATABASE_URI else ""
-async_engine = create_async_engine(
-    get_async_db_url(db_url), echo=settings.DEBUG, future=True
-)
-
-AsyncSessionLocal = async_sessionmaker(
-    bind=async_engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autocommit=False,
-    autoflush=False,
-)
-
-# Create sync engine for initialization
-# Use psycopg2 for synchronous operations
-sync_engine = create_engine(
-    str(settings.DATABASE_URI).replace("+asyncpg", ""), pool_pre_ping=True
-)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=sync_engine)
-
-
-# For FastAPI dependency injection
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Dependency function that yields async database sessions."""
-    async with AsyncSessionLocal() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
+# Kept for older scripts; these share the application's single engine and
+# connection pool from app.db.session instead of creating their own
+AsyncSessionLocal = async_session_maker
@@ -1,5 +1,6 @@
 import logging
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Dict
+from uuid import uuid4
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
@@ -12,18 +13,38 @@ logger = logging.getLogger(__name__)
 # Create async database engine
 DATABASE_URL = str(settings.DATABASE_URI)
 
-# Create async engine with thread safety
+# Connection pool settings. Tests use NullPool (fresh connection per checkout),
+# which does not accept the QueuePool sizing arguments.
+engine_options: Dict[str, Any]
+if settings.DB_USE_PGBOUNCER:
+    # PgBouncer in transaction mode pools server connections itself and cannot
+    # keep prepared statements across transactions. The asyncpg dialect still
+    # prepares named statements, so the names must be unique per statement or
+    # they collide on a shared server connection ("... already exists")
+    engine_options = {
+        "poolclass": NullPool,
+        "connect_args": {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        },
+    }
+elif settings.TESTING:
+    engine_options = {"poolclass": NullPool}
+else:
+    engine_options = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": True,
+    }
+
+# Create async engine (asyncpg driver, pooled connections reused across requests)
 async_engine = create_async_engine(
     DATABASE_URL,
-    echo=settings.DEBUG,
-    pool_pre_ping=True,
-    pool_recycle=3600,
-    pool_size=5,
-    max_overflow=10,
-    poolclass=NullPool if settings.TESTING else None,
-    connect_args=(
-        {"check_same_thread": False} if settings.TESTING else {}
-    ),  # SQLite thread safety fix
+    echo=settings.DB_ECHO,
+    **engine_options,
 )
 
 # Create async session factory
@@ -5,16 +5,20 @@ import traceback
 
 from fastapi import Depends, FastAPI, status, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.openapi.docs import get_swagger_ui_html
 from fastapi.openapi.utils import get_openapi
-from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse, RedirectResponse
 from fastapi.routing import APIRouter
 from sqlalchemy.ext.asyncio import AsyncSession  
+from starlette.types import Receive, Scope, Send
 
 # Import API routers
+from app.api.endpoints.agents import AGENT_TYPES, list_agents
 from app.api.router import api_router
-from app.crud import crud_agent
+from app.core.config import settings
 from app.db.session import get_db
+from app.services.llm_client import llm_client
 from app.core.logging_config import setup_logging
 
 # 로깅 설정 초기화
@@ -30,11 +34,19 @@ API_PREFIX = "/api/v1"
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:  
     # Startup: Initialize resources (DB connections, etc.)
     logger.info("Starting up Logy-Desk API...")
+    # Build the shared LLM client once instead of on every chat message.
+    # A missing API key should not stop the API from starting; chat requests
+    # retry initialization and store an error reply if it still fails.
+    try:
+        await llm_client.initialize()
+    except Exception as e:
+        logger.warning(f"LLM client not initialized at startup: {str(e)}")
 
     yield
 
     # Shutdown: Clean up resources
     logger.info("Shutting down Logy-Desk API...")
+    await llm_client.close()
 
 
 # Initialize FastAPI app
@@ -46,22 +58,43 @@ app = FastAPI(
     redoc_url=None,  
     openapi_url=f"{API_PREFIX}/openapi.json",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Exception handler middleware
 @app.exception_handler(Exception)
-async def global_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def global_exception_handler(
+    request: Request, exc: Exception
+) -> ORJSONResponse:
     logger.error(f"Global exception caught: {str(exc)}")
     logger.error(f"Request URL: {request.url}")
     logger.error(f"Request method: {request.method}")
     logger.error(f"Traceback: {traceback.format_exc()}")
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={"detail": f"Internal server error: {str(exc)}"}
     )
 
 
+class JSONGZipMiddleware(GZipMiddleware):
+    """GZip for regular responses; Server-Sent Event streams pass through.
+
+    The gzip stream buffers small writes, which would hold back SSE tokens
+    until enough data has accumulated.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"].endswith("/stream"):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+# Compress large JSON bodies (agent lists, chat history, document lists).
+# Added before CORS so CORS stays the outermost middleware.
+app.add_middleware(JSONGZipMiddleware, minimum_size=1024)
+
 # CORS middleware configuration
 app.add_middleware(
     CORSMiddleware,
@@ -94,12 +127,16 @@ async def legacy_list_agents(
     레거시 엔드포인트: /api/agents
 
     - type: 필터링할 에이전트 유형 (main, sub)
+
+    /api/v1/agents 의 list_agents 를 그대로 사용하며,
+    알 수 없는 유형은 기존 동작대로 필터 없이 전체 목록을 반환합니다.
     """
-    if type in ["main", "sub"]:
-        agents = await crud_agent.agent.get_multi_by_type(db, agent_type=type)
-    else:
-        agents = await crud_agent.agent.get_multi(db)
-    return agents
+    return await list_agents(
+        agent_type=type if type in AGENT_TYPES else None,
+        skip=0,
+        limit=settings.DEFAULT_PAGE_SIZE,
+        db=db,
+    )
 
 
 @legacy_router.get("/chats", include_in_schema=False)
@@ -165,4 +202,13 @@ app.openapi_schema = custom_openapi()
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run("main:app", host="0.0.0.0", port=9000, reload=True)
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=9000,
+        reload=True,
+        # "auto" picks uvloop when installed (not on Windows) and falls back
+        # to the stock asyncio loop otherwise
+        loop="auto",
+        http="httptools",
+    )
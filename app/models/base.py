@@ -1,4 +1,4 @@
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Any, Dict
 from uuid import uuid4
 
@@ -7,6 +7,8 @@ from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.ext.declarative import as_declarative, declared_attr
 from sqlalchemy.orm import Mapped, mapped_column
 
+from app.core.timeutils import utcnow
+
 
 @as_declarative()
 class BaseModel:
@@ -16,12 +18,12 @@ class BaseModel:
         PG_UUID(as_uuid=True), primary_key=True, default=uuid4
     )
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.now(timezone.utc)
+        DateTime(timezone=True), default=utcnow
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=datetime.now(timezone.utc),
-        onupdate=datetime.now(timezone.utc),
+        default=utcnow,
+        onupdate=utcnow,
     )
 
     __name__: str
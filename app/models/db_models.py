@@ -5,15 +5,16 @@ from uuid import UUID, uuid4
 
 from sqlalchemy import (
     Boolean,
+    CheckConstraint,
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     types,
 )
-from sqlalchemy.dialects import postgresql
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -33,9 +34,11 @@ class AgentTypeDB(types.TypeDecorator):
     """Custom type to handle case-insensitive enum values.
 
     Maps between Python's AgentType enum and database's lowercase values.
+    The column is a plain VARCHAR; allowed values are enforced by the
+    ``ck_agents_agent_type`` CHECK constraint on the agents table.
     """
 
-    impl = postgresql.ENUM("main", "sub", name="agenttype")
+    impl = String(8)
     cache_ok = True
 
     def __init__(self, **kwargs: Any):
@@ -63,6 +66,12 @@ class Agent(Base):
     """Agent model for AI agents."""
 
     __tablename__ = "agents"
+    __table_args__ = (
+        CheckConstraint(
+            "agent_type IN ('main', 'sub')", name="ck_agents_agent_type"
+        ),
+        Index("uq_agents_user_id_name", "user_id", "name", unique=True),
+    )
 
     id: Mapped[UUID] = mapped_column(
         PG_UUID(as_uuid=True), primary_key=True, default=uuid4
@@ -76,7 +85,7 @@ class Agent(Base):
 
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     agent_type: Mapped[AgentType] = mapped_column(
-        AgentTypeDB, nullable=False, default=AgentType.SUB
+        AgentTypeDB, nullable=False, default=AgentType.SUB, index=True
     )
     model: Mapped[str] = mapped_column(String(50), nullable=False)
     temperature: Mapped[float] = mapped_column(Float, default=0.7)
@@ -145,6 +154,10 @@ class Document(Base):
     """Document model for storing document metadata."""
 
     __tablename__ = "documents"
+    __table_args__ = (
+        # Keyset pagination of the document list, newest first
+        Index("ix_documents_created_at_id", "created_at", "id"),
+    )
 
     id: Mapped[UUID] = mapped_column(
         PG_UUID(as_uuid=True), primary_key=True, default=uuid4
@@ -178,6 +191,10 @@ class ChatSession(Base):
     """Chat session model for grouping related chat messages."""
 
     __tablename__ = "chat_sessions"
+    __table_args__ = (
+        # Keyset pagination of the session list on (created_at, id)
+        Index("ix_chat_sessions_created_at_id", "created_at", "id"),
+    )
 
     id: Mapped[UUID] = mapped_column(
         PG_UUID(as_uuid=True), primary_key=True, default=uuid4
@@ -198,7 +215,11 @@ class ChatSession(Base):
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="chat_sessions")
     messages: Mapped[List["ChatMessage"]] = relationship(
-        "ChatMessage", back_populates="session", cascade="all, delete-orphan"
+        "ChatMessage",
+        back_populates="session",
+        cascade="all, delete-orphan",
+        # Messages are removed by ON DELETE CASCADE; don't load them to delete
+        passive_deletes=True,
     )
 
     def __init__(
@@ -223,6 +244,15 @@ class ChatMessage(Base):
     """Individual chat messages within a session."""
 
     __tablename__ = "chat_messages"
+    __table_args__ = (
+        # Per-session history and keyset pagination on (created_at, id)
+        Index(
+            "ix_chat_messages_session_id_created_at_id",
+            "session_id",
+            "created_at",
+            "id",
+        ),
+    )
 
     id: Mapped[UUID] = mapped_column(
         PG_UUID(as_uuid=True), primary_key=True, default=uuid4
@@ -235,7 +265,9 @@ class ChatMessage(Base):
     )
 
     session_id: Mapped[UUID] = mapped_column(
-        PG_UUID(as_uuid=True), ForeignKey("chat_sessions.id"), nullable=False
+        PG_UUID(as_uuid=True),
+        ForeignKey("chat_sessions.id", ondelete="CASCADE"),
+        nullable=False,
     )
     role: Mapped[str] = mapped_column(
         String(20), nullable=False
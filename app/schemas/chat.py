@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 # ===============================================================================
 # Chat Message Schemas
@@ -38,8 +38,7 @@ class ChatMessageInDBBase(ChatMessageBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ChatMessage(ChatMessageInDBBase):
@@ -79,8 +78,7 @@ class ChatSessionInDBBase(ChatSessionBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ChatSession(ChatSessionInDBBase):
@@ -1,7 +1,7 @@
 import asyncio
 import json
 import logging
-from typing import Dict, List, Optional, Tuple
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 
 import httpx
 from openai import AsyncOpenAI
@@ -12,6 +12,11 @@ from app.core.config import settings
 
 DEFAULT_MODEL = "google/gemma-3-27b-it:free"
 
+# Returned instead of raising when every model and retry has failed
+FALLBACK_RESPONSE = (
+    "죄송합니다. AI 응답을 생성하는 중 오류가 발생했습니다. 잠시 후 다시 시도해주세요."
+)
+
 # Configure root logger if not already configured
 if not logging.root.handlers:
     logging.basicConfig(
@@ -22,7 +27,36 @@ if not logging.root.handlers:
 
 # Get logger for this module
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)  # Ensure debug level is set for this logger
+
+
+# Pooled HTTP client shared by every LLMClient in this process, so keep-alive
+# connections (and their TLS sessions) are reused across chat requests
+_shared_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_shared_http_client() -> httpx.AsyncClient:
+    """Return the process-wide HTTP client, creating it on first use."""
+    global _shared_http_client
+    if _shared_http_client is None or _shared_http_client.is_closed:
+        headers: Dict[str, str] = {"Content-Type": "application/json"}
+        if settings.LLM_PROVIDER.lower() == "openrouter":
+            headers.update(
+                {
+                    "Authorization": f"Bearer {settings.OPENROUTER_API_KEY}",
+                    "HTTP-Referer": "https://logy-desk.app",  # Your app's URL
+                    "X-Title": "Logy-Desk",  # Your app name
+                }
+            )
+        _shared_http_client = httpx.AsyncClient(
+            headers=headers,
+            timeout=30.0,  # Add timeout to prevent hanging
+        )
+    return _shared_http_client
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Return text cut to `limit` characters, with an ellipsis if it was cut."""
+    return text if len(text) <= limit else text[:limit] + "…"
 
 
 class LLMClient:
@@ -32,8 +66,6 @@ class LLMClient:
         self.provider = settings.LLM_PROVIDER.lower()
         self._client: Optional[AsyncOpenAI] = None
         self._http_client: Optional[httpx.AsyncClient] = None
-        self._current_model: str = settings.OPENROUTER_MODEL
-        self._tried_models: set[str] = set()  # Track models that have been tried
         # Multiple fallback models in order of preference
         self._fallback_models: List[str] = [
             "google/gemma-3-27b-it:free",
@@ -47,12 +79,11 @@ class LLMClient:
 
     async def initialize(self) -> None:
         """Initialize the LLM client based on the configured provider."""
-        logger.debug("Initializing LLM client...")
-
         if self._client is not None:
-            logger.debug("LLM client already initialized, skipping initialization")
             return
 
+        logger.debug("Initializing LLM client...")
+
         try:
             if self.provider == "openrouter":
                 logger.info(
@@ -67,17 +98,8 @@ class LLMClient:
                     logger.error(error_msg)
                     raise ValueError(error_msg)
 
-                logger.debug("Creating custom HTTP client for OpenRouter")
-                # Create custom HTTP client with required headers
-                self._http_client = httpx.AsyncClient(
-                    headers={
-                        "Authorization": f"Bearer {settings.OPENROUTER_API_KEY}",
-                        "HTTP-Referer": "https://logy-desk.app",  # Your app's URL
-                        "X-Title": "Logy-Desk",  # Your app name
-                        "Content-Type": "application/json",
-                    },
-                    timeout=30.0,  # Add timeout to prevent hanging
-                )
+                # Shared HTTP client carrying the OpenRouter headers
+                self._http_client = _get_shared_http_client()
 
                 # Initialize OpenAI client with the custom HTTP client
                 logger.debug("Initializing AsyncOpenAI client for OpenRouter")
@@ -102,14 +124,17 @@ class LLMClient:
                     raise ValueError(error_msg)
 
                 logger.debug("Initializing standard OpenAI client")
-                self._client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+                self._http_client = _get_shared_http_client()
+                self._client = AsyncOpenAI(
+                    api_key=settings.OPENAI_API_KEY, http_client=self._http_client
+                )
                 logger.info(
                     "Successfully initialized OpenAI client with model: "
                     f"{settings.OPENAI_MODEL}"
                 )
 
         except Exception as e:
-            logger.error(f"Error initializing LLM client: {str(e)}", exc_info=True)
+            logger.exception("Error initializing LLM client: %s", e)
             raise
 
     def get_model_name(self) -> str:
@@ -143,7 +168,7 @@ class LLMClient:
             return response.choices[0].message.content
 
         except Exception as e:
-            logger.warning(f"API call to {model} failed: {str(e)}")
+            logger.warning("API call to %s failed: %s", model, e)
             raise
 
     def _validate_messages(self, messages: List[Dict[str, str]]) -> None:
@@ -159,30 +184,32 @@ class LLMClient:
 
     def _log_request(self, messages: List[Dict[str, str]], model: str) -> None:
         """Log the request details."""
-        logger.info(f"Generating chat response with {self.provider} model: {model}")
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        logger.debug("Generating chat response with %s model: %s", self.provider, model)
         try:
             messages_preview = [
                 {
-                    k: (v[:100] + "..." if k == "content" and len(str(v)) > 100 else v)
+                    k: (_truncate(str(v), 100) if k == "content" else v)
                     for k, v in msg.items()
                 }
                 for msg in messages
             ]
             logger.debug(
-                "Sending messages to LLM: "
-                f"{json.dumps(messages_preview, ensure_ascii=False, indent=2)}"
+                "Sending messages to LLM: %s",
+                json.dumps(messages_preview, ensure_ascii=False, indent=2),
             )
         except Exception as e:
-            logger.warning(f"Could not log message preview: {str(e)}")
+            logger.warning("Could not log message preview: %s", e)
 
     def _get_models_to_try(self, current_model: str) -> List[str]:
-        """Get the list of models to try, including fallbacks."""
-        models_to_try = [current_model]
-        if hasattr(self, "_fallback_models"):
-            models_to_try.extend(
-                [m for m in self._fallback_models if m not in self._tried_models]
-            )
-        return models_to_try
+        """
+        Get the list of models to try, including fallbacks.
+
+        Computed per call (no instance state), so one client can be shared
+        by concurrent requests.
+        """
+        return list(dict.fromkeys([current_model, *self._fallback_models]))
 
     async def _try_model_with_retries(
         self,
@@ -192,9 +219,7 @@ class LLMClient:
         max_tokens: int,
     ) -> Optional[str]:
         """Attempt to get a response from a specific model with retries."""
-        self._tried_models.add(model)
-        self._current_model = model
-        logger.info(f"Trying model: {model}")
+        logger.debug("Trying model: %s", model)
 
         max_retries = 3
         for attempt in range(max_retries):
@@ -218,22 +243,23 @@ class LLMClient:
         if attempt < self._max_retries - 1:
             retry_delay = 1.0 * (2**attempt)
             logger.warning(
-                f"Attempt {attempt + 1} failed for model {model}: "
-                f"{str(error)}. Retrying in {retry_delay:.1f}s..."
+                "Attempt %d failed for model %s: %s. Retrying in %.1fs...",
+                attempt + 1,
+                model,
+                error,
+                retry_delay,
             )
             await asyncio.sleep(retry_delay)
             return True
 
-        logger.error(f"All {self._max_retries} attempts failed for model {model}")
+        logger.error("All %d attempts failed for model %s", self._max_retries, model)
         return False
 
     def _log_successful_response(self, response_text: str, model: str) -> None:
         """Log successful response details."""
-        response_preview = response_text[:200] + (
-            "..." if len(response_text) > 200 else ""
-        )
-        logger.debug(f"Received LLM response: {response_preview}")
-        logger.info(f"Successfully generated chat response from {model}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Received LLM response: %s", _truncate(response_text, 200))
+            logger.debug("Successfully generated chat response from %s", model)
 
     async def generate_chat_response(
         self,
@@ -274,9 +300,6 @@ class LLMClient:
         last_error: Optional[Exception] = None  # Added type hint
 
         for model_to_try in models_to_try:
-            if model_to_try in self._tried_models:
-                continue
-
             try:
                 response = await self._try_model_with_retries(
                     model=model_to_try,
@@ -293,14 +316,59 @@ class LLMClient:
 
         # If we get here, all models and retries failed
         error_msg = (
-            f"Failed to generate chat response after trying {len(self._tried_models)} "
+            f"Failed to generate chat response after trying {len(models_to_try)} "
             f"models and {self._max_retries} retries each"
         )
         if last_error:
             error_msg += f": {str(last_error)}"
 
         logger.error(error_msg)
-        return "죄송합니다. AI 응답을 생성하는 중 오류가 발생했습니다. 잠시 후 다시 시도해주세요."
+        return FALLBACK_RESPONSE
+
+    async def stream_chat_response(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        model: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        """
+        채팅 응답을 생성되는 대로 조각(delta) 단위로 반환합니다.
+
+        이미 일부 토큰을 보낸 뒤에는 다른 모델로 재시도할 수 없으므로,
+        generate_chat_response 와 달리 폴백/재시도 없이 한 모델만 사용하며
+        실패 시 예외를 그대로 전파합니다.
+
+        Args:
+            messages: 메시지 리스트 (role과 content 키를 가진 딕셔너리)
+            temperature: 샘플링 온도 (0.0 ~ 2.0)
+            max_tokens: 생성할 최대 토큰 수
+            model: 사용할 모델 이름 (None이면 기본 모델 사용)
+
+        Yields:
+            생성된 응답 텍스트 조각
+        """
+        if not self._client:
+            await self.initialize()
+        if self._client is None:
+            raise ValueError("LLM client not initialized. Call initialize() first.")
+
+        self._validate_messages(messages)
+        temperature, max_tokens = self._sanitize_parameters(temperature, max_tokens)
+        current_model = model if model else self.get_model_name()
+        self._log_request(messages, current_model)
+
+        stream = await self._client.chat.completions.create(
+            model=current_model,
+            messages=cast(list[ChatCompletionMessageParam], messages),
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=True,
+        )
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+        logger.debug("Finished streaming chat response from %s", current_model)
 
     async def close(self) -> None:
         """Close the client connection."""
@@ -0,0 +1,68 @@
+import hashlib
+import re
+from typing import Dict, Optional, Sequence
+
+from cachetools import TTLCache
+
+# Entries are kept for a limited time so answers don't go stale
+RESPONSE_CACHE_MAXSIZE = 1024
+RESPONSE_CACHE_TTL = 600  # seconds
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_query(text: str) -> str:
+    """Collapse whitespace and case so trivially different queries match."""
+    return _WHITESPACE_RE.sub(" ", text).strip().casefold()
+
+
+class ResponseCache:
+    """
+    In-process cache of LLM chat responses.
+
+    The key covers everything that shapes the answer: the cache scope
+    (user), model, temperature and the full prompt context. Only the last
+    (current) user message is normalized, so a repeated question in the
+    same conversation state reuses the earlier answer instead of calling
+    the LLM again.
+    """
+
+    def __init__(
+        self, maxsize: int = RESPONSE_CACHE_MAXSIZE, ttl: float = RESPONSE_CACHE_TTL
+    ) -> None:
+        self._cache: "TTLCache[bytes, str]" = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    @staticmethod
+    def make_key(
+        messages: Sequence[Dict[str, str]],
+        *,
+        scope: str,
+        model: str,
+        temperature: float,
+    ) -> bytes:
+        """Build a compact cache key for a chat request."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{scope}\x1f{model}\x1f{temperature}".encode())
+        for msg in messages[:-1]:
+            digest.update(f"\x1e{msg['role']}\x1f{msg['content']}".encode())
+        if messages:
+            last = messages[-1]
+            digest.update(
+                f"\x1e{last['role']}\x1f{normalize_query(last['content'])}".encode()
+            )
+        return digest.digest()
+
+    def lookup(self, key: bytes) -> Optional[str]:
+        """Return the cached response for the key, if any."""
+        return self._cache.get(key)
+
+    def store(self, key: bytes, response: str) -> None:
+        """Remember a successful response for the key."""
+        self._cache[key] = response
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+
+# Singleton instance
+response_cache = ResponseCache()
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 
 
@@ -12,7 +12,7 @@ def create_initial_migration() -> None:
     versions_dir.mkdir(parents=True, exist_ok=True)
 
     # Create a timestamp for the migration file
-    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
     migration_name = f"{timestamp}_initial_migration.py"
     migration_path = versions_dir / migration_name
 
@@ -0,0 +1,65 @@
+"""
+Drive the chat endpoint in-process so a profiler attributes time to the
+server code (session/context queries, LLM call, message inserts).
+
+Usage:
+    scalene --json --outfile chat_profile.json scripts/profile_chat.py -n 50
+
+Needs the same database and LLM settings (.env) as the app itself. With
+DEBUG logging the per-stage timings from stage_timer are logged as well.
+"""
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+from uuid import uuid4
+
+import httpx
+
+# Add the project root to the Python path
+project_root = str(Path(__file__).resolve().parent.parent)
+sys.path.append(project_root)
+
+from app.main import API_PREFIX, app  # noqa: E402
+
+
+async def profile_chat(requests: int, concurrency: int) -> None:
+    session_id = uuid4()
+    url = f"{API_PREFIX}/chat/{session_id}/messages"
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://profile"
+    ) as client:
+
+        async def send(i: int) -> None:
+            async with semaphore:
+                start = time.perf_counter()
+                response = await client.post(
+                    url, json={"role": "user", "content": f"profile message {i}"}
+                )
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - start)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(send(i) for i in range(requests)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    print(f"{requests} requests in {elapsed:.2f}s ({requests / elapsed:.1f} req/s)")
+    print(f"p50: {latencies[len(latencies) // 2] * 1000:.1f} ms")
+    print(f"p95: {latencies[int(len(latencies) * 0.95) - 1] * 1000:.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--requests", type=int, default=20)
+    parser.add_argument("-c", "--concurrency", type=int, default=4)
+    args = parser.parse_args()
+    asyncio.run(profile_chat(args.requests, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Shared test fixtures.
+
+Database tests run against the PostgreSQL server from the settings
+(POSTGRES_* or DATABASE_URI, e.g. POSTGRES_DB=logy_desk_test). Each test
+runs in one outer transaction that is rolled back afterwards, so commits
+made by the code under test never persist. When no database is reachable
+the database tests are skipped.
+"""
+import os
+
+# NullPool: pytest-asyncio gives every test its own event loop, and pooled
+# asyncpg connections cannot be shared across loops
+os.environ.setdefault("TESTING", "true")
+
+from typing import AsyncIterator  # noqa: E402
+
+import httpx  # noqa: E402
+import pytest  # noqa: E402
+import pytest_asyncio  # noqa: E402
+from sqlalchemy.dialects.postgresql import insert as pg_insert  # noqa: E402
+from sqlalchemy.exc import SQLAlchemyError  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession  # noqa: E402
+
+from app.core.config import DEFAULT_USER_ID  # noqa: E402
+from app.db.base import Base  # noqa: E402
+from app.db.session import async_engine, get_db  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.db_models import User  # noqa: E402
+
+
+@pytest_asyncio.fixture
+async def db() -> AsyncIterator[AsyncSession]:
+    """A session inside a transaction that is rolled back after the test."""
+    try:
+        conn = await async_engine.connect()
+    except (OSError, SQLAlchemyError) as e:
+        pytest.skip(f"database not available: {e}")
+    trans = await conn.begin()
+    try:
+        # DDL is transactional in PostgreSQL, so the schema is rolled back too
+        await conn.run_sync(Base.metadata.create_all)
+        # The system user the alembic migrations seed (owner of MVP data)
+        await conn.execute(
+            pg_insert(User)
+            .values(
+                id=DEFAULT_USER_ID,
+                email="system@logy-desk.local",
+                hashed_password="",
+                is_active=True,
+                is_superuser=False,
+            )
+            .on_conflict_do_nothing()
+        )
+        # Commits in the code under test release a savepoint instead
+        session = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        try:
+            yield session
+        finally:
+            await session.close()
+    finally:
+        await trans.rollback()
+        await conn.close()
+
+
+@pytest_asyncio.fixture
+async def client(db: AsyncSession) -> AsyncIterator[httpx.AsyncClient]:
+    """HTTP client for the app, with get_db bound to the test session."""
+
+    async def override_get_db() -> AsyncIterator[AsyncSession]:
+        yield db
+
+    app.dependency_overrides[get_db] = override_get_db
+    try:
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as test_client:
+            yield test_client
+    finally:
+        app.dependency_overrides.pop(get_db, None)
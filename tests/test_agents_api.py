@@ -0,0 +1,102 @@
+from typing import Iterator, List
+
+import httpx
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.endpoints import agents
+from app.core.config import DEFAULT_USER_ID
+from app.crud import crud_agent
+from app.schemas.agent import AgentCreate
+
+pytestmark = pytest.mark.asyncio
+
+AGENTS_URL = "/api/v1/agents"
+
+
+@pytest.fixture(autouse=True)
+def clear_agent_caches() -> Iterator[None]:
+    agents._agents_cache.clear()
+    crud_agent.agent.clear_main_agent_cache()
+    yield
+    agents._agents_cache.clear()
+    crud_agent.agent.clear_main_agent_cache()
+
+
+async def _create_agent_directly(db: AsyncSession, name: str) -> None:
+    # API 를 거치지 않으므로 목록 캐시가 무효화되지 않음
+    await crud_agent.agent.create(
+        db,
+        obj_in=AgentCreate(
+            name=name, agent_type="sub", model="gpt-4", user_id=DEFAULT_USER_ID
+        ),
+    )
+
+
+async def _names(client: httpx.AsyncClient) -> List[str]:
+    response = await client.get(AGENTS_URL)
+    assert response.status_code == 200
+    return sorted(agent["name"] for agent in response.json())
+
+
+async def test_list_is_served_from_the_cache(
+    client: httpx.AsyncClient, db: AsyncSession
+) -> None:
+    await _create_agent_directly(db, "first")
+    assert await _names(client) == ["first"]
+
+    await _create_agent_directly(db, "second")
+    assert await _names(client) == ["first"]
+
+
+async def test_create_clears_the_list_cache(
+    client: httpx.AsyncClient, db: AsyncSession
+) -> None:
+    assert await _names(client) == []
+
+    response = await client.post(
+        AGENTS_URL, json={"name": "new", "agent_type": "sub", "model": "gpt-4"}
+    )
+    assert response.status_code == 201
+
+    assert await _names(client) == ["new"]
+
+
+async def test_update_clears_the_list_cache(
+    client: httpx.AsyncClient, db: AsyncSession
+) -> None:
+    response = await client.post(
+        AGENTS_URL, json={"name": "old", "agent_type": "sub", "model": "gpt-4"}
+    )
+    agent_id = response.json()["id"]
+    assert await _names(client) == ["old"]
+
+    response = await client.put(f"{AGENTS_URL}/{agent_id}", json={"name": "renamed"})
+    assert response.status_code == 200
+
+    assert await _names(client) == ["renamed"]
+
+
+async def test_delete_clears_the_list_cache(
+    client: httpx.AsyncClient, db: AsyncSession
+) -> None:
+    response = await client.post(
+        AGENTS_URL, json={"name": "gone", "agent_type": "sub", "model": "gpt-4"}
+    )
+    agent_id = response.json()["id"]
+    assert await _names(client) == ["gone"]
+
+    response = await client.delete(f"{AGENTS_URL}/{agent_id}")
+    assert response.status_code == 204
+
+    assert await _names(client) == []
+
+
+async def test_cache_is_keyed_by_filter_and_page(
+    client: httpx.AsyncClient, db: AsyncSession
+) -> None:
+    await _create_agent_directly(db, "sub agent")
+
+    assert len((await client.get(AGENTS_URL, params={"agent_type": "sub"})).json()) == 1
+    assert (await client.get(AGENTS_URL, params={"agent_type": "main"})).json() == []
+    assert (await client.get(AGENTS_URL, params={"skip": 1})).json() == []
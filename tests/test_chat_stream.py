@@ -0,0 +1,19 @@
+from uuid import UUID
+
+import orjson
+from asyncpg.pgproto import pgproto
+
+from app.api.endpoints.chat import _sse_event
+
+
+def test_sse_event_serializes_database_uuids() -> None:
+    # INSERT ... RETURNING 으로 받은 id 는 asyncpg 의 UUID 타입
+    message_id = pgproto.UUID("12a4042f-0697-42c2-b625-df760b0517b7")
+
+    event = _sse_event({"done": True, "message_id": message_id})
+
+    assert event.startswith(b"data: ") and event.endswith(b"\n\n")
+    assert orjson.loads(event[len(b"data: ") :]) == {
+        "done": True,
+        "message_id": str(UUID("12a4042f-0697-42c2-b625-df760b0517b7")),
+    }
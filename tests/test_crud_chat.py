@@ -0,0 +1,180 @@
+from datetime import timedelta
+from typing import List
+from uuid import UUID
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import DEFAULT_USER_ID
+from app.core.timeutils import utcnow
+from app.crud import crud_chat
+from app.models.models import ChatMessage, ChatSession
+from app.schemas.chat import ChatMessageCreate, ChatSessionCreate
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _create_sessions(db: AsyncSession, count: int) -> List[ChatSession]:
+    # 한 트랜잭션 안의 now() 는 같으므로 모든 세션의 created_at 이 같음 (동률)
+    return [
+        await crud_chat.chat_session.create(
+            db, obj_in=ChatSessionCreate(title=f"session {i}", user_id=DEFAULT_USER_ID)
+        )
+        for i in range(count)
+    ]
+
+
+async def _create_messages(
+    db: AsyncSession, session_id: UUID, count: int
+) -> List[ChatMessage]:
+    return await crud_chat.chat_message.create_many_with_session(
+        db,
+        objs_in=[
+            ChatMessageCreate(role="user", content=f"message {i}") for i in range(count)
+        ],
+        session_id=session_id,
+        created_at=utcnow(),
+    )
+
+
+async def test_session_cursor_pages_through_created_at_ties(db: AsyncSession) -> None:
+    sessions = await _create_sessions(db, 5)
+    assert len({s.created_at for s in sessions}) == 1
+
+    seen: List[UUID] = []
+    page = await crud_chat.chat_session.get_multi_after(db, limit=2)
+    while page:
+        seen.extend(s.id for s in page)
+        last = page[-1]
+        page = await crud_chat.chat_session.get_multi_after(
+            db, after=last.created_at, after_id=last.id, limit=2
+        )
+
+    # 동률인 행도 id 로 순서가 정해져 누락이나 중복 없이 모두 한 번씩 나옴
+    assert seen == sorted(s.id for s in sessions)
+
+
+async def test_session_cursor_without_id_skips_created_at_ties(
+    db: AsyncSession,
+) -> None:
+    sessions = await _create_sessions(db, 3)
+
+    page = await crud_chat.chat_session.get_multi_after(
+        db, after=sessions[0].created_at
+    )
+
+    # after 만 주면 created_at 이 더 큰 행만 조회되므로 동률인 행은 제외됨
+    assert page == []
+
+
+async def test_session_cursor_id_alone_is_ignored(db: AsyncSession) -> None:
+    sessions = await _create_sessions(db, 3)
+    last_id = max(s.id for s in sessions)
+
+    page = await crud_chat.chat_session.get_multi_after(db, after_id=last_id)
+
+    assert [s.id for s in page] == sorted(s.id for s in sessions)
+
+
+async def test_session_cursor_past_the_end_returns_empty_page(db: AsyncSession) -> None:
+    sessions = await _create_sessions(db, 2)
+    last = max(sessions, key=lambda s: s.id)
+
+    assert (
+        await crud_chat.chat_session.get_multi_after(
+            db, after=last.created_at, after_id=last.id
+        )
+        == []
+    )
+    assert (
+        await crud_chat.chat_session.get_multi_after(
+            db, after=last.created_at + timedelta(seconds=1)
+        )
+        == []
+    )
+
+
+async def test_create_many_with_session_orders_messages_in_one_statement(
+    db: AsyncSession,
+) -> None:
+    (session,) = await _create_sessions(db, 1)
+
+    messages = await _create_messages(db, session.id, 3)
+
+    # 메시지마다 1마이크로초씩 증가하므로 입력 순서가 created_at 순서와 같음
+    created = [m.created_at for m in messages]
+    assert created == sorted(created)
+    assert len(set(created)) == 3
+    assert [m.content for m in messages] == ["message 0", "message 1", "message 2"]
+
+
+async def test_message_cursor_pages_in_insert_order(db: AsyncSession) -> None:
+    (session,) = await _create_sessions(db, 1)
+    messages = await _create_messages(db, session.id, 5)
+
+    seen: List[UUID] = []
+    page = await crud_chat.chat_message.get_multi_by_session(
+        db, session_id=session.id, limit=2
+    )
+    while page:
+        seen.extend(m.id for m in page)
+        last = page[-1]
+        page = await crud_chat.chat_message.get_multi_by_session(
+            db,
+            session_id=session.id,
+            after=last.created_at,
+            after_id=last.id,
+            limit=2,
+        )
+
+    assert seen == [m.id for m in messages]
+
+
+async def test_message_cursor_pages_through_created_at_ties(db: AsyncSession) -> None:
+    (session,) = await _create_sessions(db, 1)
+    created_at = utcnow()
+    # 두 번의 INSERT 가 같은 created_at 으로 시작하면 첫 메시지끼리 동률
+    messages = [
+        *await crud_chat.chat_message.create_many_with_session(
+            db,
+            objs_in=[ChatMessageCreate(role="user", content="a")],
+            session_id=session.id,
+            created_at=created_at,
+        ),
+        *await crud_chat.chat_message.create_many_with_session(
+            db,
+            objs_in=[ChatMessageCreate(role="user", content="b")],
+            session_id=session.id,
+            created_at=created_at,
+        ),
+    ]
+    first, second = sorted(messages, key=lambda m: m.id)
+
+    page = await crud_chat.chat_message.get_multi_by_session(
+        db, session_id=session.id, after=first.created_at, after_id=first.id
+    )
+
+    assert [m.id for m in page] == [second.id]
+
+
+async def test_message_list_of_empty_session_is_empty(db: AsyncSession) -> None:
+    (session,) = await _create_sessions(db, 1)
+
+    assert (
+        await crud_chat.chat_message.get_multi_by_session(db, session_id=session.id)
+        == []
+    )
+
+
+async def test_recent_messages_exclude_messages_at_or_after_before(
+    db: AsyncSession,
+) -> None:
+    (session,) = await _create_sessions(db, 1)
+    messages = await _create_messages(db, session.id, 3)
+
+    found, context = await crud_chat.chat_session.get_with_recent_messages(
+        db, session_id=session.id, before=messages[2].created_at
+    )
+
+    assert found is not None and found.id == session.id
+    assert [m.content for m in context] == ["message 0", "message 1"]
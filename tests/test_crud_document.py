@@ -0,0 +1,104 @@
+from datetime import timedelta
+from typing import List
+from uuid import UUID
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import DEFAULT_USER_ID
+from app.crud import crud_document
+from app.models.db_models import Document
+from app.schemas.document import DocumentCreate
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _create_documents(db: AsyncSession, count: int) -> List[Document]:
+    # now() is fixed within a transaction, so every created_at is the same
+    return [
+        await crud_document.document.create(
+            db,
+            obj_in=DocumentCreate(
+                user_id=DEFAULT_USER_ID,
+                file_name=f"doc{i}.txt",
+                file_path=f"uploads/doc{i}.txt",
+                file_size=i,
+                file_type="text/plain",
+            ),
+        )
+        for i in range(count)
+    ]
+
+
+async def test_cursor_pages_through_created_at_ties(db: AsyncSession) -> None:
+    documents = await _create_documents(db, 5)
+    assert len({d.created_at for d in documents}) == 1
+
+    seen: List[UUID] = []
+    page = await crud_document.document.get_summaries(db, limit=2)
+    while page:
+        seen.extend(row.id for row in page)
+        last = page[-1]
+        page = await crud_document.document.get_summaries(
+            db, before=last.created_at, before_id=last.id, limit=2
+        )
+
+    # Newest first, ties broken by id descending, each row exactly once
+    assert seen == sorted((d.id for d in documents), reverse=True)
+
+
+async def test_cursor_without_id_skips_created_at_ties(db: AsyncSession) -> None:
+    documents = await _create_documents(db, 3)
+
+    page = await crud_document.document.get_summaries(
+        db, before=documents[0].created_at
+    )
+
+    assert page == []
+
+
+async def test_cursor_id_alone_is_ignored(db: AsyncSession) -> None:
+    documents = await _create_documents(db, 3)
+
+    page = await crud_document.document.get_summaries(
+        db, before_id=min(d.id for d in documents)
+    )
+
+    assert [row.id for row in page] == sorted(
+        (d.id for d in documents), reverse=True
+    )
+
+
+async def test_cursor_past_the_end_returns_empty_page(db: AsyncSession) -> None:
+    documents = await _create_documents(db, 2)
+    oldest = min(documents, key=lambda d: d.id)
+
+    assert (
+        await crud_document.document.get_summaries(
+            db, before=oldest.created_at, before_id=oldest.id
+        )
+        == []
+    )
+    assert (
+        await crud_document.document.get_summaries(
+            db, before=oldest.created_at - timedelta(seconds=1)
+        )
+        == []
+    )
+
+
+async def test_summaries_with_total_counts_all_rows(db: AsyncSession) -> None:
+    await _create_documents(db, 3)
+
+    rows, total = await crud_document.document.get_summaries_with_total(
+        db, limit=2
+    )
+    assert len(rows) == 2
+    assert total == 3
+
+    # A page past the end has no row to carry the window count
+    rows, total = await crud_document.document.get_summaries_with_total(
+        db, skip=10, limit=2
+    )
+    assert rows == []
+    assert total == 3
@@ -0,0 +1,99 @@
+from pathlib import Path
+from typing import Iterator
+
+import httpx
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.endpoints import documents
+from app.core.config import DEFAULT_USER_ID
+from app.crud import crud_document
+from app.models.db_models import Document
+from app.schemas.document import DocumentCreate
+
+pytestmark = pytest.mark.asyncio
+
+DOCUMENTS_URL = "/api/v1/documents"
+
+
+@pytest.fixture(autouse=True)
+def clear_document_count_cache() -> Iterator[None]:
+    documents._document_count_cache.clear()
+    yield
+    documents._document_count_cache.clear()
+
+
+async def _create_document(db: AsyncSession, name: str) -> Document:
+    return await crud_document.document.create(
+        db,
+        obj_in=DocumentCreate(
+            user_id=DEFAULT_USER_ID,
+            file_name=name,
+            file_path=f"uploads/{name}",
+            file_size=1,
+            file_type="text/plain",
+        ),
+    )
+
+
+async def _total(client: httpx.AsyncClient) -> int:
+    response = await client.get(DOCUMENTS_URL)
+    assert response.status_code == 200
+    return response.json()["pagination"]["total"]
+
+
+async def test_total_count_is_cached(
+    client: httpx.AsyncClient, db: AsyncSession
+) -> None:
+    await _create_document(db, "a.txt")
+    assert await _total(client) == 1
+
+    # Rows written behind the API's back are not seen until the TTL expires
+    await _create_document(db, "b.txt")
+    assert await _total(client) == 1
+
+
+async def test_delete_clears_the_count_cache(
+    client: httpx.AsyncClient, db: AsyncSession
+) -> None:
+    document = await _create_document(db, "a.txt")
+    await _create_document(db, "b.txt")
+    assert await _total(client) == 2
+
+    response = await client.delete(f"{DOCUMENTS_URL}/{document.id}")
+    assert response.status_code == 204
+
+    assert await _total(client) == 1
+
+
+async def test_upload_clears_the_count_cache(
+    client: httpx.AsyncClient,
+    db: AsyncSession,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(documents, "UPLOAD_PATH", tmp_path)
+    assert await _total(client) == 0
+
+    response = await client.post(
+        f"{DOCUMENTS_URL}/upload",
+        files={"file": ("notes.txt", b"hello", "text/plain")},
+    )
+    assert response.status_code == 200
+
+    assert await _total(client) == 1
+
+
+async def test_timestamps_use_the_z_suffix(
+    client: httpx.AsyncClient, db: AsyncSession
+) -> None:
+    document = await _create_document(db, "a.txt")
+
+    listed = (await client.get(DOCUMENTS_URL)).json()
+    detail = (await client.get(f"{DOCUMENTS_URL}/{document.id}")).json()
+
+    uploaded_at = listed["documents"][0]["uploaded_at"]
+    assert uploaded_at.endswith("Z")
+    assert "+" not in uploaded_at
+    assert detail["uploaded_at"] == uploaded_at
+    assert listed["pagination"]["next_before"] == uploaded_at
@@ -0,0 +1,51 @@
+from datetime import timedelta
+
+import pytest
+from jose import JWTError, jwt
+
+from app.core.config import settings
+from app.core.security import _encode_hs256, create_access_token
+from app.core.timeutils import utcnow
+
+
+def test_encode_hs256_matches_jose() -> None:
+    claims = {"sub": "user@example.com", "exp": 1700000000, "scope": ["a", "b"]}
+
+    assert _encode_hs256(claims) == jwt.encode(
+        claims, settings.SECRET_KEY, algorithm="HS256"
+    )
+
+
+def test_encode_hs256_round_trips_non_ascii_claims() -> None:
+    claims = {"sub": "사용자", "exp": int(utcnow().timestamp()) + 60}
+
+    token = _encode_hs256(claims)
+
+    assert jwt.get_unverified_header(token) == {"alg": "HS256", "typ": "JWT"}
+    assert jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"]) == claims
+
+
+def test_encode_hs256_signer_is_reused_without_state() -> None:
+    # Each token signs a copy of the keyed HMAC, so earlier tokens must not
+    # leak into the signature of later ones
+    first = _encode_hs256({"sub": "a"})
+    _encode_hs256({"sub": "b"})
+
+    assert _encode_hs256({"sub": "a"}) == first
+
+
+def test_create_access_token_sets_expiry() -> None:
+    before = int(utcnow().timestamp())
+
+    token = create_access_token({"sub": "user"}, expires_delta=timedelta(minutes=5))
+
+    claims = jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
+    assert claims["sub"] == "user"
+    assert before + 300 <= claims["exp"] <= before + 301
+
+
+def test_create_access_token_rejects_wrong_key() -> None:
+    token = create_access_token({"sub": "user"})
+
+    with pytest.raises(JWTError):
+        jwt.decode(token, settings.SECRET_KEY + "x", algorithms=["HS256"])